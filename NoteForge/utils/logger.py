@@ -3,6 +3,7 @@ NoteForge Logger Module
 Provides cross-platform logging functionality.
 """
 
+import functools
 import logging
 import sys
 import os
@@ -10,6 +11,13 @@ from datetime import datetime
 from pathlib import Path
 
 
+# Shared by every handler setup_logger creates
+_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
 def setup_logger(name: str = 'noteforge', level: int = logging.INFO) -> logging.Logger:
     """
     Set up a logger with consistent formatting across platforms.
@@ -30,18 +38,14 @@ def setup_logger(name: str = 'noteforge', level: int = logging.INFO) -> logging.
     
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    
-    formatter = logging.Formatter(
-        fmt='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     
     logger.addHandler(console_handler)
     
     return logger
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
@@ -50,7 +54,7 @@ def get_logger(name: str) -> logging.Logger:
         name: Logger name (will be prefixed with 'noteforge.')
     
     Returns:
-        Logger instance
+        Logger instance (memoized per name)
     """
     if not name.startswith('noteforge.'):
         name = f'noteforge.{name}'
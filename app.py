@@ -4,13 +4,12 @@ import queue
 import time
 import os
 import json
-import random
-import numpy as np
-import sounddevice as sd
+import functools
 import config_manager
-import torch
 import wave
 
+# Periodic FPS stats; off under python -O or unless NOTEFORGE_DEBUG is set
+DEBUG = __debug__ and bool(os.environ.get("NOTEFORGE_DEBUG"))
 
 # Conditional import for webrtcvad
 webrtcvad_available = False
@@ -25,8 +24,8 @@ except ImportError:
     webrtcvad_module = DummyVad() # Use a different name to avoid conflict with actual module
 
 import collections
-from datetime import datetime
-from tkinter import filedialog, messagebox
+# tkinter.filedialog / messagebox are imported where they are used, so they
+# are not loaded before the window is first drawn
 
 # --- Dependencies Check ---
 try:
@@ -34,10 +33,66 @@ try:
 except ImportError:
     vosk = None
 
+# --- Heavy modules, imported on first use (torch alone is ~1 s / ~200 MB) ---
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    import numpy
+    return numpy
+
+@functools.lru_cache(maxsize=None)
+def _sounddevice():
+    import sounddevice
+    return sounddevice
+
+@functools.lru_cache(maxsize=None)
+def _torch():
+    import torch
+    return torch
+
+@functools.lru_cache(maxsize=None)
+def _whisper():
+    """openai-whisper module, or None if not installed"""
+    try:
+        import whisper
+        return whisper
+    except ImportError:
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _faster_whisper_model():
+    """faster_whisper.WhisperModel (optional CTranslate2 int8 backend), or None"""
+    try:
+        from faster_whisper import WhisperModel
+        return WhisperModel
+    except ImportError:
+        return None
+
 try:
-    import whisper
+    import orjson # Optional C JSON parser for Vosk results
+    _json_loads = orjson.loads
 except ImportError:
-    whisper = None
+    _json_loads = json.loads
+
+
+def _raise_thread_priority():
+    """Best-effort real-time priority for the calling (audio) thread; needs CAP_SYS_NICE
+    on Linux. Returns False (and logs) when the priority was left unchanged."""
+    try:
+        if hasattr(os, "sched_setscheduler"): # Linux: pid 0 is the calling thread
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+        elif os.name == "nt":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 15): # THREAD_PRIORITY_TIME_CRITICAL
+                raise OSError(f"SetThreadPriority failed (error {kernel32.GetLastError()})")
+        else:
+            # macOS: no portable per-thread priority call from Python
+            print("DEBUG: Audio thread priority unchanged: not supported on this platform")
+            return False
+        return True
+    except (OSError, AttributeError) as e:
+        print(f"DEBUG: Audio thread priority unchanged: {e}")
+        return False
 
 class PerformanceMonitor:
     def __init__(self):
@@ -62,6 +117,51 @@ class PerformanceMonitor:
         self.stats = {k:0 for k in self.stats}
         self.start_time = time.time()
 
+class SPSCRing:
+    """Single-producer/single-consumer ring of preallocated fixed-size frame slots,
+    each with a one-byte flag (the VAD decision) stored alongside.
+
+    Only the producer writes _head and only the consumer writes _tail; plain int
+    stores are atomic under the GIL, so neither side takes a lock.
+    """
+    def __init__(self, capacity, slot_size):
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self._slots = [bytearray(slot_size) for _ in range(capacity)]
+        self._flags = bytearray(capacity) # Parallel flag per slot, no tuple per frame
+        self._head = 0 # Total frames pushed (producer only)
+        self._tail = 0 # Total frames popped (consumer only)
+
+    def __len__(self):
+        return self._head - self._tail
+
+    def try_push(self, data, flag=False):
+        """Copy one frame (bytes or a contiguous numpy block) into the next free slot;
+        False if full or wrong size"""
+        head = self._head
+        size = data.nbytes if hasattr(data, "nbytes") else len(data)
+        if head - self._tail >= self.capacity or size != self.slot_size:
+            return False
+        idx = head % self.capacity
+        self._slots[idx][:] = data # In-place copy, no allocation
+        self._flags[idx] = 1 if flag else 0
+        self._head = head + 1
+        return True
+
+    def clear(self):
+        """Drop everything queued in O(1); only while producer and consumer are both idle"""
+        self._tail = self._head
+
+    def try_pop(self):
+        """Return (frame bytes, flag) for the oldest frame, or None if empty"""
+        tail = self._tail
+        if tail == self._head:
+            return None
+        idx = tail % self.capacity
+        item = (bytes(self._slots[idx]), self._flags[idx] == 1)
+        self._tail = tail + 1
+        return item
+
 class HybridTranscriberApp(ctk.CTkToplevel):
     def __init__(self, master=None):
         super().__init__(master)
@@ -80,38 +180,52 @@ class HybridTranscriberApp(ctk.CTkToplevel):
         self.FRAME_DURATION_MS = 20
         self.FRAME_SIZE = int(self.SAMPLE_RATE * self.FRAME_DURATION_MS / 1000) # 320 samples for 20ms
         self.FRAME_BYTES = self.FRAME_SIZE * 2 # 16-bit PCM = 2 bytes per sample -> 640 bytes
+        self.VAD_ENERGY_FLOOR = 80.0 # int16 RMS below which a backlogged frame is silence (~-52 dBFS)
         # Robust Model Path Detection
         self.VOSK_MODEL_PATH = self._find_model_path()
         self.WHISPER_MODEL_SIZE = config_manager.get_setting("whisper_model_size")
 
         # --- State ---
         self.is_recording = False
+        self._stop_evt = threading.Event() # Set while not recording; workers wait on it instead of polling
+        self._stop_evt.set()
         self.device_ready = False
-        self.recording_buffer = []
+        self.wav_session = None # Current session's incremental WAV writer (see wav_writer_loop)
+        self._word_count = 0 # Words currently in the textbox, kept incrementally
+        self._transcript_chunks = [] # Python-side copy of the textbox so save/export skip get("1.0", END)
+        self._status_text = "Ready" # Mirrors status_label to skip no-op reconfigures
+        self._meter_tick = 0 # Capture frames since the last meter update
+        self._last_fps_log = 0.0 # monotonic() of the last FPS debug line
         
         # Ensure recordings directory exists
-        self.recordings_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings")
+        self.recordings_dir = os.path.join(config_manager.PROJECT_ROOT, "recordings")
         os.makedirs(self.recordings_dir, exist_ok=True)
         # --- Dual Queue Architecture ---
-        self.vad_queue = queue.Queue(maxsize=100)      # Fast VAD processing (small buffer)
-        self.vosk_queue = queue.Queue(maxsize=500)     # Slow Vosk processing (buffer for batching)
+        # Capture runs VAD inline and hands (frame, is_speech) straight to Vosk
+        self.vosk_ring = SPSCRing(500, self.FRAME_BYTES) # Capture -> Vosk frames (lock-free)
         self.whisper_queue = queue.Queue()     # Completed sentences (numpy array)
-        self.display_queue = queue.Queue()     # UI updates (type, text)
-        self.meter_queue = queue.Queue()       # Audio level updates
+        self.display_queue = queue.Queue(maxsize=256) # UI updates (type, text)
+        self.meter_queue = queue.SimpleQueue() # Audio level updates (unbounded, single producer/consumer)
+        self._display_drain_pending = False    # Drain already scheduled on the Tk loop
+        self._last_posted = {}                 # Last status/partial queued, for coalescing
+        # Workers may only call after() on a threaded Tcl; otherwise the Tk thread
+        # polls display_queue itself (see _poll_display_queue)
+        self._tk_thread = threading.current_thread()
+        try:
+            self._cross_thread_after = self.tk.getvar("tcl_platform(threaded)") in ("1", 1, True)
+        except Exception:
+            self._cross_thread_after = False
 
-        self.last_queue_sizes = []
+        self.last_queue_sizes = collections.deque(maxlen=10)
+        self._queue_sizes_total = 0 # Running sum of last_queue_sizes
         self.queue_warning_threshold = 400
         self.vad_debug = False  # Set to True for debugging
 
         self.vosk_model = None
+        self.vosk_rec = None
         self.whisper_model = None
-        self.device = "cuda" if torch.cuda.is_available() else ("mps" if torch.backends.mps.is_available() else "cpu")
-        print(f"INFO: Using device for transcription: {self.device}")
-        
-        if self.device == "cpu":
-            # Optimize CPU threading for inference
-            import multiprocessing
-            torch.set_num_threads(min(multiprocessing.cpu_count(), 4))
+        self.whisper_backend = None # "faster" (faster-whisper) or "openai"
+        self._device = None # Resolved on first use, see the device property
         if webrtcvad_available:
             self.vad = webrtcvad.Vad(2) # Mode 2: Aggressive
         else:
@@ -121,12 +235,13 @@ class HybridTranscriberApp(ctk.CTkToplevel):
         if vosk and os.path.exists(self.VOSK_MODEL_PATH):
             try:
                 self.vosk_model = vosk.Model(self.VOSK_MODEL_PATH)
+                # One long-lived recognizer, Reset() per session instead of rebuilt
+                self.vosk_rec = vosk.KaldiRecognizer(self.vosk_model, self.SAMPLE_RATE)
             except Exception as e:
                 print(f"Vosk Load Error: {e}")
 
         # Threads
         self.capture_thread = None
-        self.vad_thread = None
         self.vosk_thread = None
         self.whisper_thread = None
         
@@ -142,10 +257,29 @@ class HybridTranscriberApp(ctk.CTkToplevel):
         # --- UI Layout ---
         self.create_widgets()
         
-        # --- Start Main Loop ---
-        self.update_ui_loop()
+        # The meter loop only runs while recording (started in start_recording),
+        # so an idle window has no periodic Tk wakeups
+        self._ui_loop_active = False
+        self._empty_ticks = 0 # Consecutive meter polls that found nothing
+        if not self._cross_thread_after:
+            self._poll_display_queue()
+
+    @property
+    def device(self):
+        """Transcription device; torch is only imported the first time this is read"""
+        if self._device is None:
+            torch = _torch()
+            self._device = "cuda" if torch.cuda.is_available() else ("mps" if torch.backends.mps.is_available() else "cpu")
+            print(f"INFO: Using device for transcription: {self._device}")
+            
+            if self._device == "cpu":
+                # Optimize CPU threading for inference
+                import multiprocessing
+                torch.set_num_threads(min(multiprocessing.cpu_count(), 4))
+        return self._device
 
     def get_available_devices(self):
+        sd = _sounddevice()
         self.devices_list = []
         try:
             # Get default input device index
@@ -160,12 +294,14 @@ class HybridTranscriberApp(ctk.CTkToplevel):
         except Exception as e:
             print(f"Error getting audio devices: {e}")
             self.devices_list = [(None, "Default Device")]
+        # Menu label -> device index, so change_mic is a single lookup
+        self.device_index_by_name = {name: idx for idx, name in self.devices_list}
 
     def _find_model_path(self):
         """Search for the Vosk model in multiple logical locations"""
-        base_dir = os.path.dirname(os.path.abspath(__file__))
+        base_dir = config_manager.PROJECT_ROOT
         possible_paths = [
-            os.path.join(base_dir, "model"),                     # NoteForge/model
+            config_manager.VOSK_MODEL_DIR,                       # NoteForge/model
             os.path.join(os.path.dirname(base_dir), "model"),    # Exp/model
             os.path.join(os.path.dirname(os.path.dirname(base_dir)), "model") # Desktop/model (fallback)
         ]
@@ -269,57 +405,117 @@ class HybridTranscriberApp(ctk.CTkToplevel):
 
     def summarize_text(self):
         """Trigger summarization of current transcription"""
-        text = self.textbox.get("1.0", ctk.END).strip()
-        if not text:
+        if not self._word_count: # O(1) emptiness check via the running count
+            from tkinter import messagebox
             messagebox.showwarning("Warning", "No text to summarize!")
             return
+        text = self.get_transcript().strip()
 
         self.summarize_btn.configure(state="disabled", text="Summarizing...")
-        self.status_label.configure(text="Summarizing text...")
+        self.set_status("Summarizing text...")
         
         # Start background thread
-        self.summarization_thread = threading.Thread(target=self.run_summarization, args=(text,))
+        self.summarization_thread = threading.Thread(target=self.run_summarization, args=(text, self._word_count))
         self.summarization_thread.start()
 
-    def run_summarization(self, text):
+    def run_summarization(self, text, word_count):
         """Background thread for BART summarization"""
         try:
-            from transformers import pipeline
             if self.bart_model == None:
                 # Load model naturally (transformers handles downloading/caching)
                 model_name = config_manager.get_setting("bart_model_name", "facebook/bart-large-cnn")
-                self.bart_model = pipeline("summarization", model=model_name)
+                self.bart_model = self.load_bart_pipeline(model_name)
             
-            # Simple chunking for very long text to avoid index errors
-            max_chunk = 3000 # chars ~ 750 tokens
-            chunks = [text[i:i+max_chunk] for i in range(0, len(text), max_chunk)]
+            chunks = self.token_chunks(text)
             
-            summaries = []
-            for chunk in chunks:
-                 if len(chunk) < 50: continue
-                 # Use default BART parameters as requested
-                 res = self.bart_model(chunk, max_length=130, min_length=30, do_sample=False)
-                 summaries.append(res[0]['summary_text'])
+            # One chunk at a time: the shared pipeline and fast tokenizer aren't
+            # thread-safe, and each generate already uses torch's intra-op threads
+            summaries = [self.summarize_chunk(c) for c in chunks if len(c) >= 50]
             
             full_summary = " ".join(summaries)
             
             # Schedule UI update
-            self.after(0, lambda: self.show_summary_popup(text, full_summary))
+            self.after(0, lambda: self.show_summary_popup(word_count, full_summary))
             
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Summarization Error", str(e)))
+            from tkinter import messagebox
+            self.after(0, lambda e=e: messagebox.showerror("Summarization Error", str(e)))
         finally:
             self.after(0, lambda: self.summarize_btn.configure(state="normal", text="Summarize 🪄"))
-            self.after(0, lambda: self.status_label.configure(text="Ready"))
+            self.after(0, lambda: self.set_status("Ready"))
+
+    def token_chunks(self, text, overlap=128):
+        """Split text into windows that fill BART's input budget, with a small token
+        overlap so sentences on a boundary are seen whole by one of the windows.
+        """
+        tok = self.bart_model.tokenizer
+        window = min(tok.model_max_length, 1024) - 2 # Room for <s> and </s>
+        ids = tok(text, add_special_tokens=False, verbose=False)["input_ids"]
+        step = window - overlap
+        return [tok.decode(ids[start:start + window], skip_special_tokens=True)
+                for start in range(0, max(len(ids) - overlap, 1), step)]
+
+    def summarize_chunk(self, chunk):
+        """Summarize one transcript chunk (runs on the summarization thread)"""
+        # Use default BART parameters as requested
+        res = self.bart_model(chunk, max_length=130, min_length=30, do_sample=False)
+        return res[0]['summary_text']
+
+    def load_bart_pipeline(self, model_name):
+        """Summarization pipeline backed by an int8 ONNX Runtime export of BART when
+        optimum is installed (cached in ~/.cache/noteforge_bart_int8), else plain PyTorch.
+        """
+        from transformers import pipeline, AutoTokenizer
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        except ImportError:
+            return pipeline("summarization", model=model_name)
+
+        try:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "noteforge_bart_int8", model_name.replace("/", "--"))
+            if not os.path.isdir(cache_dir):
+                # One-time export + dynamic int8 quantization, built aside then moved into place
+                import shutil, platform
+                self.post_display("status", "Optimizing BART (one-time)...")
+                export_dir, build_dir = cache_dir + ".fp32", cache_dir + ".tmp"
+                shutil.rmtree(export_dir, ignore_errors=True)
+                shutil.rmtree(build_dir, ignore_errors=True)
+                ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True).save_pretrained(export_dir)
+                if platform.machine() in ("arm64", "aarch64"):
+                    qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=True)
+                else:
+                    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+                for onnx_name in os.listdir(export_dir):
+                    if onnx_name.endswith(".onnx"):
+                        ORTQuantizer.from_pretrained(export_dir, file_name=onnx_name).quantize(save_dir=build_dir, quantization_config=qconfig)
+                for extra in os.listdir(export_dir): # Config, generation config, tokenizer files
+                    if not extra.endswith(".onnx") and not os.path.exists(os.path.join(build_dir, extra)):
+                        shutil.copy2(os.path.join(export_dir, extra), build_dir)
+                AutoTokenizer.from_pretrained(model_name).save_pretrained(build_dir)
+                os.replace(build_dir, cache_dir)
+                shutil.rmtree(export_dir, ignore_errors=True)
 
-    def show_summary_popup(self, original_text, summary):
+            files = set(os.listdir(cache_dir))
+            kwargs = {"encoder_file_name": "encoder_model_quantized.onnx", "decoder_file_name": "decoder_model_quantized.onnx"}
+            if "decoder_with_past_model_quantized.onnx" in files:
+                kwargs["decoder_with_past_file_name"] = "decoder_with_past_model_quantized.onnx"
+            else:
+                kwargs["use_cache"] = False
+            model = ORTModelForSeq2SeqLM.from_pretrained(cache_dir, provider="CPUExecutionProvider", **kwargs)
+            print(f"DEBUG: BART loaded as int8 ONNX from {cache_dir}")
+            return pipeline("summarization", model=model, tokenizer=AutoTokenizer.from_pretrained(cache_dir))
+        except Exception as e:
+            print(f"DEBUG: ONNX BART unavailable, using PyTorch: {e}")
+            return pipeline("summarization", model=model_name)
+
+    def show_summary_popup(self, orig_count, summary):
         """Display summary in modal popup"""
         popup = ctk.CTkToplevel(self)
         popup.title("Summary")
         popup.geometry("600x500")
         
         # Setup popup UI
-        orig_count = len(original_text.split())
         summ_count = len(summary.split())
         ctk.CTkLabel(popup, text=f"Original: {orig_count} words | Summary: {summ_count} words", font=("Segoe UI", 12, "bold")).pack(pady=10)
         
@@ -333,12 +529,15 @@ class HybridTranscriberApp(ctk.CTkToplevel):
         def copy_to_clipboard():
             self.clipboard_clear()
             self.clipboard_append(summary)
+            from tkinter import messagebox
             messagebox.showinfo("Copied", "Summary copied to clipboard!")
             
         def insert_to_main():
             self.textbox.configure(state="normal")
             self.textbox.insert(ctk.END, f"\n\n[SUMMARY]\n{summary}\n\n", "black")
             self.textbox.configure(state="disabled")
+            self._word_count += len(summary.split()) + 1
+            self._transcript_chunks.append(f"\n\n[SUMMARY]\n{summary}\n\n")
             popup.destroy()
 
         ctk.CTkButton(btn_frame, text="Copy", command=copy_to_clipboard).pack(side="left", padx=10)
@@ -346,10 +545,9 @@ class HybridTranscriberApp(ctk.CTkToplevel):
         ctk.CTkButton(btn_frame, text="Close", command=popup.destroy, fg_color="gray").pack(side="left", padx=10)
 
     def change_mic(self, choice):
-        for idx, name in self.devices_list:
-            if name == choice:
-                self.selected_mic_index = idx
-                print(f"Selected Mic Index: {idx}")
+        if choice in self.device_index_by_name:
+            self.selected_mic_index = self.device_index_by_name[choice]
+            print(f"Selected Mic Index: {self.selected_mic_index}")
 
     def toggle_recording(self):
         if self.is_recording:
@@ -359,240 +557,343 @@ class HybridTranscriberApp(ctk.CTkToplevel):
 
     def start_recording(self):
         if not self.vosk_model:
+            from tkinter import messagebox
             messagebox.showerror("Error", "Vosk model not found! Please run download_models.py")
             return
 
+        # The previous session's capture/Vosk threads still own the ring and the shared
+        # recognizer until they have drained (up to a full ring through AcceptWaveform).
+        # Never start alongside them: two ring consumers break the SPSC contract
+        for t in (self.capture_thread, self.vosk_thread):
+            if t and t.is_alive():
+                t.join(timeout=1.0)
+        if any(t and t.is_alive() for t in (self.capture_thread, self.vosk_thread)):
+            self.record_btn.configure(state="disabled")
+            self.set_status("Finishing previous session...")
+            self._wait_for_previous_session()
+            return
+
         self.is_recording = True
         self.record_btn.configure(text="Stop Recording", fg_color="#F1AA9B", text_color="#312C51")
-        self.status_label.configure(text="Connecting to Mic...")
-        self.recording_buffer = [] # Clear buffer for new session
-        
-        # Clear queues robustly
-        for q in [self.vad_queue, self.vosk_queue]:
-            while not q.empty():
-                try: q.get_nowait()
-                except queue.Empty: break
-            
-        with self.whisper_queue.mutex: self.whisper_queue.queue.clear()
+        self.set_status("Connecting to Mic...")
+        
+        # Session WAV is written incrementally by its own thread, fed by capture
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        self.wav_session = {
+            "timestamp": timestamp,
+            "audio_path": os.path.join(self.recordings_dir, f"recording_{timestamp}.wav"),
+            "queue": queue.Queue(maxsize=1500), # ~30 s of frames if the disk stalls
+            "frames": 0,
+        }
+        self.wav_session["thread"] = threading.Thread(target=self.wav_writer_loop, args=(self.wav_session,))
+        self.wav_session["thread"].start()
         
-        time.sleep(0.1) # Ensure clean state
+        # Per-session Whisper queue: Vosk ends it with a None sentinel, so an old
+        # session's sentinel can never stop the new Whisper thread
+        self.whisper_queue = queue.Queue()
+        self.vosk_ring.clear() # Both ends have exited (checked above): O(1) clear, no stale frames
+        if self.vosk_rec is not None:
+            self.vosk_rec.Reset()
+        # Fresh stop event per session: clearing the old one would revive old workers
+        self._stop_evt = threading.Event()
 
         # Start Threads
-        self.capture_thread = threading.Thread(target=self.audio_capture_loop)
-        self.vad_thread = threading.Thread(target=self.vad_processing_loop)
-        self.vosk_thread = threading.Thread(target=self.vosk_processing_loop)
-        self.whisper_thread = threading.Thread(target=self.whisper_processing_loop)
+        self.capture_thread = threading.Thread(target=self.audio_capture_loop, args=(self.wav_session["queue"],))
+        self.vosk_thread = threading.Thread(target=self.vosk_processing_loop, args=(self.whisper_queue,))
+        self.whisper_thread = threading.Thread(target=self.whisper_processing_loop, args=(self.whisper_queue,))
         
         self.capture_thread.start()
-        self.vad_thread.start()
         self.vosk_thread.start()
         self.whisper_thread.start()
         
         self.monitor_queues()
+        if not self._ui_loop_active:
+            self._ui_loop_active = True
+            self.update_ui_loop()
+
+    def _wait_for_previous_session(self):
+        """Re-enables the record button once the old capture/Vosk threads have exited"""
+        if any(t and t.is_alive() for t in (self.capture_thread, self.vosk_thread)):
+            self.after(100, self._wait_for_previous_session)
+            return
+        self.record_btn.configure(state="normal")
+        self.set_status("Ready")
 
     def monitor_queues(self):
         """Monitors queue sizes and warns if near capacity"""
         if not self.is_recording:
             return
 
-        # Monitor VAD queue (the entry point bottleneck)
-        vad_qsize = self.vad_queue.qsize()
+        # Monitor the Vosk ring (the entry point bottleneck)
+        ring_size = len(self.vosk_ring)
+        capacity = self.vosk_ring.capacity
         
-        # Track last 10 samples
-        self.last_queue_sizes.append(vad_qsize)
-        if len(self.last_queue_sizes) > 10:
-            self.last_queue_sizes.pop(0)
+        # Track last 10 samples (the deque evicts the oldest itself)
+        if len(self.last_queue_sizes) == self.last_queue_sizes.maxlen:
+            self._queue_sizes_total -= self.last_queue_sizes[0]
+        self.last_queue_sizes.append(ring_size)
+        self._queue_sizes_total += ring_size
         
-        # Warn if queue consistently near capacity
-        if vad_qsize > 80: # 80% of 100
-            avg_size = sum(self.last_queue_sizes) / len(self.last_queue_sizes)
-            if avg_size > 80:
-                 self.display_queue.put(("status", f"System Overloaded! Skipping frames... ({vad_qsize}/100)"))
+        # Warn if ring consistently near capacity (80%)
+        if ring_size > capacity * 0.8:
+            avg_size = self._queue_sizes_total / len(self.last_queue_sizes)
+            if avg_size > capacity * 0.8:
+                 self.post_display("status", f"System Overloaded! Skipping frames... ({ring_size}/{capacity})")
         
         # Schedule next check (1s)
         self.after(1000, self.monitor_queues)
 
     def stop_recording(self):
         self.is_recording = False
+        self._stop_evt.set() # Wakes the Vosk loop; it then sends Whisper its EOF sentinel
         self.record_btn.configure(text="Start Recording", fg_color="#F0C38E", text_color="#312C51")
         self.level_bar.set(0)
         
-        # Export recording to WAV and Text
-        if self.recording_buffer:
-            try:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                audio_filename = f"recording_{timestamp}.wav"
-                text_filename = f"transcript_{timestamp}.txt"
-                
-                # Ensure recordings directory exists
-                os.makedirs(self.recordings_dir, exist_ok=True)
-                
-                # 1. Save Audio
-                audio_path = os.path.join(self.recordings_dir, audio_filename)
-                with wave.open(audio_path, 'wb') as wf:
-                    wf.setnchannels(1)
-                    wf.setsampwidth(2) # 16-bit
-                    wf.setframerate(self.SAMPLE_RATE)
-                    wf.writeframes(b"".join(self.recording_buffer))
-                
-                # 2. Save Text
-                text_path = os.path.join(self.recordings_dir, text_filename)
-                transcript = self.textbox.get("1.0", ctk.END).strip()
-                with open(text_path, "w", encoding="utf-8") as f:
-                    f.write(transcript)
-                
-                self.status_label.configure(text=f"Saved: Audio & Transcript", text_color="#F0C38E")
-                print(f"DEBUG: Saved {audio_filename} and {text_filename}")
-            except Exception as e:
-                print(f"DEBUG: Error saving session: {e}")
-                self.status_label.configure(text="Error saving files", text_color="red")
+        # Finish the WAV and save the transcript (off the UI thread)
+        session = self.wav_session
+        self.wav_session = None
+        if session:
+            transcript = self.get_transcript().strip()
+            self.set_status("Saving session...")
+            threading.Thread(target=self.export_session, args=(session, transcript)).start()
         else:
-            self.status_label.configure(text="Stopped (No Audio)")
+            self.set_status("Stopped (No Audio)")
 
-    def audio_capture_loop(self):
-        """Captures raw audio using SoundDevice (Blocking Mode for Stability)"""
+    def wav_writer_loop(self, session):
+        """Background thread: streams captured frames into the session WAV.
+        Frames are written in ~0.5 s batches; None (sent by capture on exit) closes the file.
+        """
+        frames_q = session["queue"]
+        pending = []
+        eof = False
+        try:
+            os.makedirs(self.recordings_dir, exist_ok=True)
+            with wave.open(session["audio_path"], 'wb') as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2) # 16-bit
+                wf.setframerate(self.SAMPLE_RATE)
+                while True:
+                    frame = frames_q.get()
+                    eof = frame is None
+                    if frame is not None:
+                        pending.append(frame)
+                    if len(pending) >= 25 or (frame is None and pending):
+                        wf.writeframes(b"".join(pending))
+                        session["frames"] += len(pending)
+                        pending = []
+                    if frame is None:
+                        break
+        except Exception as e:
+            print(f"DEBUG: WAV writer error: {e}")
+            session["error"] = e
+            # Keep draining so capture's blocking EOF put always completes
+            while not eof:
+                eof = frames_q.get() is None
+
+    def export_session(self, session, transcript):
+        """Background thread: waits for the session WAV to close, then writes the transcript"""
+        def status(text, **kwargs):
+            try:
+                self.after(0, lambda: self.set_status(text, **kwargs))
+            except Exception:
+                pass # Window closed while saving; the files are still written
+
+        try:
+            session["thread"].join()
+            if session.get("error"):
+                raise session["error"]
+
+            timestamp = session["timestamp"]
+            audio_filename = os.path.basename(session["audio_path"])
+            text_filename = f"transcript_{timestamp}.txt"
+            
+            if not session["frames"]:
+                # Nothing was captured: don't leave an empty WAV behind
+                os.remove(session["audio_path"])
+                status("Stopped (No Audio)")
+                return
+            
+            # Save Text
+            text_path = os.path.join(self.recordings_dir, text_filename)
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write(transcript)
+            
+            status("Saved: Audio & Transcript", text_color="#F0C38E")
+            print(f"DEBUG: Saved {audio_filename} and {text_filename}")
+        except Exception as e:
+            print(f"DEBUG: Error saving session: {e}")
+            status("Error saving files", text_color="red")
+
+    def audio_capture_loop(self, wav_q=None):
+        """Captures raw audio using a SoundDevice callback and processes frames from its ring"""
         print(f"DEBUG: Audio capture thread started with mic index {self.selected_mic_index}")
+        np, sd = _numpy(), _sounddevice()
+        _raise_thread_priority() # Keep busy Vosk/Whisper threads from starving the frame consumer
+        monitor = self.monitor
+        stop_evt = self._stop_evt
+        in_ring = SPSCRing(100, self.FRAME_BYTES) # ~2 s between PortAudio and this thread
+        drop_tick = 0 # Frames seen, for the overload drop pattern
+
+        def on_audio(indata, frames, time_info, status):
+            # PortAudio's real-time thread: no prints, locks or waits, just the ring copy
+            if status.input_overflow:
+                monitor.log('input_overflow')
+            if not in_ring.try_push(indata):
+                monitor.log('dropped_capture')
+
         try:
-            self.display_queue.put(("status", "Connecting to Mic..."))
+            self.post_display("status", "Connecting to Mic...")
             with sd.InputStream(samplerate=self.SAMPLE_RATE,
                                 blocksize=self.FRAME_SIZE,
                                 device=self.selected_mic_index,
                                 channels=1,
-                                dtype='int16') as stream: # No callback = blocking mode
+                                dtype='int16',
+                                latency='low', # Smaller host buffer, fewer ms of input lag
+                                callback=on_audio):
                 
-                self.display_queue.put(("status", "Mic Connected. Listening..."))
+                self.post_display("status", "Mic Connected. Listening...")
                 print("DEBUG: sd.InputStream active.")
                 
-                while self.is_recording:
+                while not stop_evt.is_set() or len(in_ring):
                     try:
-                        # Blocking read
-                        indata, overflowed = stream.read(self.FRAME_SIZE)
-                        
-                        if overflowed:
-                            # Just log it, don't crash. Blocking mode usually handles this better.
-                            # print("Audio buffer overflow (internal)") 
-                            pass
-                        
-                        frame_bytes = indata.tobytes()
+                        item = in_ring.try_pop()
+                        if item is None:
+                            stop_evt.wait(0.005) # Quarter frame; returns at once on stop
+                            continue
+                        batch = [item[0]]
+                        if len(in_ring) > 30:
+                            # Backlog: catch up in blocks of up to 16 frames, gated by one
+                            # vectorized energy pass instead of a VAD call per frame
+                            while len(batch) < 16:
+                                nxt = in_ring.try_pop()
+                                if nxt is None:
+                                    break
+                                batch.append(nxt[0])
+                        loud = self.energy_gate(np, batch) if len(batch) > 1 else None
                         
-                        # --- Phase 1: Stabilization & Backoff ---
-                        self.monitor.log('captured')
-                        q_size = self.vad_queue.qsize()
+                        for i, frame_bytes in enumerate(batch):
+                            # --- Phase 1: Stabilization & Backoff ---
+                            self.monitor.log('captured')
+                            q_size = len(self.vosk_ring)
                         
-                        if q_size > 60: # 60% full
-                            # Progressive Drop Logic
-                            drop_prob = 0.3 if q_size < 80 else 0.8
-                            if random.random() < drop_prob:
+                            # Progressive Drop Logic (deterministic): every 3rd frame past 60% full,
+                            # every 2nd past 80%, so drop rates are predictable and reproducible
+                            drop_mod = 0 if q_size <= 300 else (3 if q_size < 400 else 2)
+                            drop_tick += 1
+                            if drop_mod and drop_tick % drop_mod == 0:
                                 self.monitor.log('dropped_capture')
-                                continue # processing loop is blocking, so just continue to next read
+                                continue # Drop this frame and move on to the next one
                         
-                        # Strict VAD frame size validation
-                        # 1. Accumulate for export
-                        self.recording_buffer.append(indata.tobytes())
+                            # Strict VAD frame size validation
+                            # 1. Stream to the session WAV writer (drop rather than block the mic)
+                            if wav_q is not None:
+                                try:
+                                    wav_q.put_nowait(frame_bytes)
+                                except queue.Full:
+                                    self.monitor.log('dropped_wav')
                         
-                        # 2. Push to VAD queue
-                        if len(frame_bytes) == self.FRAME_BYTES:
-                            try:
-                                self.vad_queue.put_nowait(frame_bytes)
-                            except queue.Full:
-                                # Emergency Clear if totally full
+                            # 2. VAD inline (a few microseconds of C) instead of a separate thread;
+                            #    frames the backlog gate already found silent skip the call
+                            if loud is not None and not loud[i]:
+                                is_active = False
+                            else:
                                 try:
-                                    self.vad_queue.get_nowait() # Make space
-                                    self.vad_queue.put_nowait(frame_bytes) # Push new est
+                                    is_active = self.vad.is_speech(frame_bytes, self.SAMPLE_RATE)
                                 except:
-                                    pass
-                        else:
-                            pass # Drop mismatched frames
-
-                        # Update Meter (Optimized: Calculate only if needed or skip occasionally?)
-                        # Calculating RMS every 20ms is fine for numpy
-                        try:
-                             # Robust Volume Calculation
-                             audio_data = indata.astype(np.float32).flatten()
-                             peak = np.max(np.abs(audio_data))
-                             self.meter_queue.put(float(peak / 20000.0))
-                        except Exception as e:
-                             if self.vad_debug: print(f"DEBUG: Meter Error: {e}")
-                             pass
+                                    is_active = False
+                            self.monitor.log('processed_vad')
+
+                            # 3. Push to Vosk ring (mismatched frames are rejected by try_push)
+                            if not self.vosk_ring.try_push(frame_bytes, is_active):
+                                # Ring full: only the consumer may free slots, so drop the new frame
+                                self.monitor.log('dropped_vad')
+
+                            # Update Meter every 3rd frame (~16 Hz, as fast as the bar redraws)
+                            try:
+                                 self._meter_tick = (self._meter_tick + 1) % 3
+                                 if self._meter_tick == 0:
+                                     # Peak straight on the int16 samples, no float32 copy
+                                     peak = int(np.abs(np.frombuffer(frame_bytes, dtype=np.int16)).max())
+                                     self.meter_queue.put_nowait(peak / 20000.0)
+                            except Exception as e:
+                                 if self.vad_debug: print(f"DEBUG: Meter Error: {e}")
+                                 pass
 
                     except Exception as e:
-                        print(f"Read Error: {e}")
+                        print(f"Frame Error: {e}")
                         break
                         
         except Exception as e:
-            self.display_queue.put(("error", f"Mic Error: {e}"))
-            self.stop_recording()
-
-    def vad_processing_loop(self):
-        """Phase 2: VAD Processing Thread
-        Consumes from vad_queue, runs VAD, pushes (frame, is_speech) to vosk_queue.
-        """
-        while self.is_recording or not self.vad_queue.empty():
-            try:
-                data = self.vad_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
+            self.post_display("error", f"Mic Error: {e}")
+            self.after(0, self.stop_recording)
+        finally:
+            # Capture is the only producer, so it signals EOF to the WAV writer.
+            # Blocking: the writer drains until EOF even after an error, and
+            # export_session waits on it
+            if wav_q is not None:
+                wav_q.put(None)
 
-            try:
-                is_active = self.vad.is_speech(data, self.SAMPLE_RATE)
-            except:
-                is_active = False
-            
-            self.monitor.log('processed_vad')
+    def energy_gate(self, np, frames):
+        """Per-frame 'loud enough to be speech' mask for a block of frames, in one NumPy pass.
+        Frames under the RMS floor are treated as silence without calling webrtcvad."""
+        samples = np.frombuffer(b"".join(frames), dtype=np.int16).reshape(len(frames), -1).astype(np.float32)
+        mean_square = np.einsum('ij,ij->i', samples, samples) / samples.shape[1]
+        return mean_square > self.VAD_ENERGY_FLOOR ** 2
 
-            # Forward to Vosk Queue
-            # We pass a tuple: (frame_bytes, is_speech_bool)
-            try:
-                self.vosk_queue.put_nowait((data, is_active))
-            except queue.Full:
-                self.monitor.log('dropped_vad')
-                pass # If Vosk is falling behind, we drop VAD-processed frames. 
-                     # This is better than stalling VAD.
-
-    def vosk_processing_loop(self):
+    def vosk_processing_loop(self, whisper_q):
         """Processes buffer for Real-time (Vosk) + Whisper Buffering"""
         try:
             print("DEBUG: Vosk processing loop started.")
-            rec = vosk.KaldiRecognizer(self.vosk_model, self.SAMPLE_RATE)
+            if self.vosk_rec is None:
+                self.vosk_rec = vosk.KaldiRecognizer(self.vosk_model, self.SAMPLE_RATE)
+            rec = self.vosk_rec
             
-            # Audio buffer for the current sentence (Whisper)
-            sentence_buffer = collections.deque()
+            # Audio buffer for the current sentence (Whisper): one contiguous bytearray,
+            # extended in place, trimmed from the front, capped at 30 s (oldest dropped)
+            fb = self.FRAME_BYTES
+            sentence_buffer = bytearray()
+            max_sentence_bytes = 30 * self.SAMPLE_RATE * 2
             silence_frames = 0
             is_speech = False
             
             # Batching for Vosk (Reduced for snappier partials)
-            batch_audio = []
             batch_size_frames = 5 # 100ms (Reduced from 10)
+            batch_audio = bytearray(batch_size_frames * self.FRAME_BYTES) # Reused every batch
+            batch_off = 0
+            last_partial_raw = None # Vosk repeats the same partial JSON between words
             
-            while self.is_recording or not self.vosk_queue.empty():
-                try:
-                    # Fetch tuple
-                    data, is_active = self.vosk_queue.get(timeout=0.1)
-                except queue.Empty:
-                    # Process remaining batch if any
-                    if batch_audio:
-                         pass 
+            ring = self.vosk_ring
+            stop_evt = self._stop_evt
+            while not stop_evt.is_set() or len(ring):
+                item = ring.try_pop()
+                if item is None:
+                    # Back off a quarter frame; returns at once when recording stops
+                    stop_evt.wait(0.005)
                     continue
+                data, is_active = item
 
                 # --- 1. Vosk Recognition (Batched) ---
-                batch_audio.append(data)
+                batch_audio[batch_off:batch_off + self.FRAME_BYTES] = data
+                batch_off += self.FRAME_BYTES
                 self.monitor.log('processed_vosk')
                 
-                if len(batch_audio) >= batch_size_frames:
-                    # Process Batch
-                    joined = b"".join(batch_audio)
-                    if rec.AcceptWaveform(joined):
-                        result = json.loads(rec.Result())
+                if batch_off == len(batch_audio):
+                    # Process Batch (Vosk wants bytes: one copy instead of list + join)
+                    if rec.AcceptWaveform(bytes(batch_audio)):
+                        result = _json_loads(rec.Result())
+                        last_partial_raw = None
                         text = result.get("text", "")
                         if text:
-                            self.display_queue.put(("draft", text))
+                            self.post_display("draft", text)
                     else:
-                        partial = json.loads(rec.PartialResult())
-                        p_text = partial.get("partial", "")
-                        if p_text:
-                            self.display_queue.put(("partial", p_text))
+                        partial_raw = rec.PartialResult()
+                        if partial_raw != last_partial_raw: # Unchanged: skip the parse entirely
+                            last_partial_raw = partial_raw
+                            p_text = _json_loads(partial_raw).get("partial", "")
+                            if p_text:
+                                self.post_display("partial", p_text)
                     
-                    batch_audio = [] # Reset
+                    batch_off = 0 # Reset
 
                 # --- 2. Buffer Management for Whisper ---
                 MIN_SILENCE_FRAMES = 25  # 500ms
@@ -601,174 +902,377 @@ class HybridTranscriberApp(ctk.CTkToplevel):
                     if not is_speech:
                         is_speech = True
                         silence_frames = 0
-                        while len(sentence_buffer) > 3:
-                            sentence_buffer.popleft()
+                        del sentence_buffer[:-3 * fb] # Keep 3 frames of lead-in
                     
                     silence_frames = 0
-                    sentence_buffer.append(data)
+                    sentence_buffer += data
+                    if len(sentence_buffer) > max_sentence_bytes:
+                        del sentence_buffer[:len(sentence_buffer) - max_sentence_bytes]
                 
                 else: # Silence
                     if is_speech:
                         silence_frames += 1
-                        sentence_buffer.append(data)
+                        sentence_buffer += data
                         
                         if silence_frames > MIN_SILENCE_FRAMES: 
-                            full_audio = b"".join(sentence_buffer)
+                            full_audio = bytes(sentence_buffer)
                             
                             if len(full_audio) > self.SAMPLE_RATE * 0.5 * 2: 
                                 try:
-                                    self.whisper_queue.put_nowait(full_audio)
-                                    self.display_queue.put(("status", "Improving accuracy..."))
+                                    whisper_q.put_nowait(full_audio)
+                                    self.post_display("status", "Improving accuracy...")
                                 except queue.Full:
                                     print("Whisper queue full, sentence dropped")
                             
-                            sentence_buffer.clear()
+                            del sentence_buffer[:]
                             is_speech = False
                             silence_frames = 0
                     else: 
-                         sentence_buffer.append(data)
-                         while len(sentence_buffer) > 10:
-                             sentence_buffer.popleft()
+                         sentence_buffer += data
+                         if len(sentence_buffer) > 10 * fb: # Rolling 10-frame pre-roll
+                             del sentence_buffer[:len(sentence_buffer) - 10 * fb]
 
         except Exception as e:
             print(f"DEBUG: Vosk Loop Error: {e}")
-            self.display_queue.put(("error", f"Vosk Error: {e}"))
+            self.post_display("error", f"Vosk Error: {e}")
+        finally:
+            whisper_q.put(None) # Vosk is Whisper's only producer: signal EOF
 
-    def whisper_processing_loop(self):
+    def whisper_processing_loop(self, whisper_q):
         """Loads Whisper (once) and processes sentences for accuracy"""
         print("DEBUG: Whisper thread started.")
-        if not whisper:
-            self.display_queue.put(("error", "Whisper module not found."))
+        np, whisper, WhisperModel = _numpy(), _whisper(), _faster_whisper_model()
+        if not whisper and WhisperModel is None:
+            self.post_display("error", "Whisper module not found.")
             return
 
         try:
             if self.whisper_model is None:
-                self.display_queue.put(("status", f"Checking hardware ({self.device})..."))
+                self.post_display("status", f"Checking hardware ({self.device})...")
                 print(f"DEBUG: Loading Whisper on device: {self.device}")
                 time.sleep(0.1)
-                self.display_queue.put(("status", f"Loading Whisper {self.WHISPER_MODEL_SIZE}..."))
-                self.whisper_model = whisper.load_model(self.WHISPER_MODEL_SIZE, device=self.device)
-                print("DEBUG: Whisper model loaded successfully.")
-                self.display_queue.put(("status", "Whisper Ready. Listening..."))
+                self.post_display("status", f"Loading Whisper {self.WHISPER_MODEL_SIZE}...")
+                if WhisperModel is not None:
+                    try:
+                        # CTranslate2 has no MPS backend; int8 on CPU, int8_float16 on CUDA
+                        ct2_device = "cuda" if self.device == "cuda" else "cpu"
+                        compute_type = "int8_float16" if ct2_device == "cuda" else "int8"
+                        self.whisper_model = WhisperModel(self.WHISPER_MODEL_SIZE, device=ct2_device, compute_type=compute_type)
+                        self.whisper_backend = "faster"
+                    except Exception as e:
+                        print(f"DEBUG: faster-whisper load failed, falling back to openai-whisper: {e}")
+                        if not whisper:
+                            raise
+                if self.whisper_model is None:
+                    self.whisper_model = whisper.load_model(self.WHISPER_MODEL_SIZE, device=self.device)
+                    self.whisper_backend = "openai"
+                print(f"DEBUG: Whisper model loaded successfully ({self.whisper_backend}).")
+                self.warmup_whisper(np)
+                self.post_display("status", "Whisper Ready. Listening...")
         except Exception as e:
-            self.display_queue.put(("error", f"Whisper Load Error: {e}"))
+            self.post_display("error", f"Whisper Load Error: {e}")
             return
 
-        while self.is_recording or not self.whisper_queue.empty():
-            try:
-                audio_bytes = self.whisper_queue.get(timeout=1)
-            except queue.Empty:
-                continue
+        while True:
+            audio_bytes = whisper_q.get() # Blocks with no periodic wakeups
+            if audio_bytes is None: # EOF from the Vosk thread
+                break
 
             try:
                 # Convert bytes to float32 numpy array for Whisper
-                audio_np = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+                # (one fused ufunc: cast and scale in a single pass, one output array)
+                audio_np = np.multiply(np.frombuffer(audio_bytes, dtype=np.int16), np.float32(1.0 / 32768.0), dtype=np.float32)
                 
                 # Transcribe (Optimized for Speed)
-                # fp16 only if using CUDA
-                use_fp16 = True if self.device == "cuda" else False
-                
-                result = self.whisper_model.transcribe(
-                    audio_np, 
-                    fp16=use_fp16, 
-                    language="english",
-                    beam_size=1,        # Faster (original default is often 5)
-                    best_of=1,          # Faster
-                    patience=1.0        # Default
-                )
-                text = result.get("text", "").strip()
+                if self.whisper_backend == "faster":
+                    segments, _ = self.whisper_model.transcribe(
+                        audio_np,
+                        language="en",
+                        beam_size=1,
+                        vad_filter=False,                 # Sentences are already VAD-gated
+                        condition_on_previous_text=False  # Each sentence stands alone
+                    )
+                    text = " ".join(seg.text for seg in segments).strip()
+                else:
+                    # fp16 only if using CUDA
+                    use_fp16 = True if self.device == "cuda" else False
+                    
+                    result = self.whisper_model.transcribe(
+                        audio_np, 
+                        fp16=use_fp16, 
+                        language="english",
+                        beam_size=1,        # Faster (original default is often 5)
+                        best_of=1,          # Faster
+                        patience=1.0        # Default
+                    )
+                    text = result.get("text", "").strip()
                 
                 if text:
-                    self.display_queue.put(("final", text))
+                    self.post_display("final", text)
                     
             except Exception as e:
                  print(f"Whisper Error: {e}")
 
-    def update_ui_loop(self):
+    def warmup_whisper(self, np):
+        """Transcribe 1 s of silence so the first real sentence doesn't pay kernel setup/autotune"""
         try:
-            # 1. Handle Display Updates
-            while not self.display_queue.empty():
+            warmup = np.zeros(self.SAMPLE_RATE, dtype=np.float32)
+            if self.whisper_backend == "faster":
+                segments, _ = self.whisper_model.transcribe(warmup, language="en", beam_size=1)
+                list(segments) # Segments are lazy; force the decode
+            else:
+                self.whisper_model.transcribe(warmup, fp16=self.device == "cuda", language="english", beam_size=1, best_of=1)
+            if self.device == "cuda":
+                _torch().cuda.synchronize()
+        except Exception as e:
+            print(f"DEBUG: Whisper warm-up skipped: {e}")
+
+    def post_display(self, msg_type, content):
+        """Queue a UI update and wake the Tk loop to drain it (thread-safe)"""
+        if msg_type in ("status", "partial"):
+            # Transient messages: coalesce repeats, drop if the UI is behind
+            if self._last_posted.get(msg_type) == content:
+                return
+            self._last_posted[msg_type] = content
+            try:
+                self.display_queue.put_nowait((msg_type, content))
+            except queue.Full:
+                return
+        else:
+            try:
+                self.display_queue.put((msg_type, content), timeout=1.0)
+            except queue.Full:
+                print(f"DEBUG: Display queue full, dropped {msg_type} message")
+                return
+
+        if not self._cross_thread_after and threading.current_thread() is not self._tk_thread:
+            return # _poll_display_queue picks it up
+        if not self._display_drain_pending:
+            self._display_drain_pending = True
+            try:
+                self.after(0, self._drain_display_queue)
+            except Exception:
+                # Window destroyed or Tcl refused the call; don't block later wakes
+                self._display_drain_pending = False
+
+    def _poll_display_queue(self):
+        """Non-threaded Tcl only: drains display_queue from the Tk thread every 50 ms"""
+        if not self.display_queue.empty():
+            self._drain_display_queue()
+        self.after(50, self._poll_display_queue)
+
+    def _drain_display_queue(self):
+        """Applies all pending display messages on the main thread"""
+        self._display_drain_pending = False
+        edits = [] # ("drafts", text) / ("final", text), applied in one textbox edit pass
+        drafts = [] # Consecutive drafts are inserted with a single Tk call
+        status = None # Only the newest status of a batch is shown
+        errors = [] # Shown together after the batch, one dialog
+        while True:
+            try:
+                msg_type, content = self.display_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            try:
+                if msg_type == "status":
+                    status = content
+                elif msg_type == "error":
+                    errors.append(content)
+                elif msg_type == "partial":
+                    pass 
+                elif msg_type == "draft":
+                    drafts.append(f"[Draft] {content}\n")
+                elif msg_type == "final":
+                    # Flush first so the final replaces the right draft line
+                    if drafts:
+                        edits.append(("drafts", "".join(drafts)))
+                        drafts = []
+                    edits.append(("final", content))
+            except Exception as e:
+                print(f"DEBUG: UI Update Error (msg={msg_type}): {e}")
+
+        if drafts:
+            edits.append(("drafts", "".join(drafts)))
+        if edits:
+            # One normal/disabled toggle and at most one see() for the whole batch
+            follow = self._is_scrolled_to_end()
+            self.textbox.configure(state="normal")
+            for kind, text in edits:
                 try:
-                    msg_type, content = self.display_queue.get_nowait()
-                    
-                    if msg_type == "status":
-                        self.status_label.configure(text=content)
-                    elif msg_type == "error":
-                        messagebox.showerror("Error", content)
-                    elif msg_type == "partial":
-                        pass 
-                    elif msg_type == "draft":
-                        self.insert_text(f"[Draft] {content}\n", "gray")
-                    elif msg_type == "final":
-                        self.replace_last_draft_with_final(content)
-                except queue.Empty:
-                    break
+                    if kind == "drafts":
+                        self._append_text(text, "gray")
+                    else:
+                        self._apply_final(text)
                 except Exception as e:
-                    print(f"DEBUG: UI Update Error (msg={msg_type}): {e}")
+                    print(f"DEBUG: UI Update Error (msg={kind}): {e}")
+            if follow:
+                self.textbox.see(ctk.END)
+            self.textbox.configure(state="disabled")
+        if status is not None:
+            self.set_status(status)
+        if errors:
+            from tkinter import messagebox
+            messagebox.showerror("Error", "\n".join(errors))
 
-            # 2. Handle Meter
+    def update_ui_loop(self):
+        drained = 0
+        try:
+            # 1. Handle Meter: drain to the newest level, one set() per tick
+            level = None
             try:
-                if not self.meter_queue.empty():
+                while True:
                     level = self.meter_queue.get_nowait()
-                    level = max(0.0, min(1.0, float(level)))
-                    self.level_bar.set(level)
-            except Exception as e:
-                # print(f"DEBUG: Meter UI Error: {e}")
+                    drained += 1
+            except queue.Empty:
                 pass
+            if level is not None:
+                try:
+                    self.level_bar.set(max(0.0, min(1.0, float(level))))
+                except Exception as e:
+                    # print(f"DEBUG: Meter UI Error: {e}")
+                    pass
             
-            # 3. Debug Stats
-            if self.is_recording and random.random() < 0.05:
+            # 2. Debug Stats
+            now = time.monotonic()
+            if DEBUG and self.is_recording and now - self._last_fps_log > 2.0:
+                 self._last_fps_log = now
                  print(f"FPS: Cap={self.monitor.get_fps('captured')} VAD={self.monitor.get_fps('processed_vad')} Vosk={self.monitor.get_fps('processed_vosk')}")
 
         except Exception as e:
             print(f"DEBUG: Global UI Loop Error: {e}")
         
-        # Always reschedule to prevent hang
-        interval = 50 if self.is_recording else 200
-        self.after(interval, self.update_ui_loop)
+        # Reschedule only while recording; start_recording restarts the loop.
+        # Poll fast while levels are arriving, back off (up to 200 ms) while none are
+        if self.is_recording:
+            if drained:
+                self._empty_ticks = 0
+                interval = 20
+            else:
+                self._empty_ticks += 1
+                interval = min(200, 20 * self._empty_ticks)
+            self.after(interval, self.update_ui_loop)
+        else:
+            self._ui_loop_active = False
+
+    def set_status(self, text, text_color=None):
+        """Updates the status label, skipping the Tk call when nothing changed"""
+        if text == self._status_text and text_color is None:
+            return
+        self._status_text = text
+        self._last_posted["status"] = text
+        if text_color is None:
+            self.status_label.configure(text=text)
+        else:
+            self.status_label.configure(text=text, text_color=text_color)
+
+    def _is_scrolled_to_end(self):
+        """True when the user is following the live transcript"""
+        return self.textbox.yview()[1] >= 0.999
+
+    def get_transcript(self):
+        """Full transcript text from the Python-side mirror"""
+        return "".join(self._transcript_chunks)
+
+    def _drop_last_draft_chunk(self):
+        """Remove the last [Draft] line from the mirror, same span textbox.search would find"""
+        for i in range(len(self._transcript_chunks) - 1, -1, -1):
+            chunk = self._transcript_chunks[i]
+            start = chunk.rfind("[Draft]")
+            if start == -1:
+                continue
+            end = chunk.find("\n", start)
+            end = len(chunk) if end == -1 else end + 1
+            removed = chunk[start:end]
+            rest = chunk[:start] + chunk[end:]
+            if rest:
+                self._transcript_chunks[i] = rest
+            else:
+                del self._transcript_chunks[i]
+            return removed
+        return ""
 
     def insert_text(self, text, tag):
+        follow = self._is_scrolled_to_end()
         self.textbox.configure(state="normal")
-        self.textbox.insert(ctk.END, text, tag)
-        self.textbox.see(ctk.END)
+        self._append_text(text, tag)
+        if follow:
+            self.textbox.see(ctk.END)
         self.textbox.configure(state="disabled")
 
+    def _append_text(self, text, tag):
+        """Append to the textbox and its mirror; caller holds state normal"""
+        self._word_count += len(text.split())
+        self._transcript_chunks.append(text)
+        start = self.textbox.index("end-1c")
+        self.textbox.insert(ctk.END, text, tag)
+        last = text.rfind("[Draft]")
+        if last != -1:
+            # Track the newest draft line so a final can drop it without a search
+            self.textbox.mark_set("last_draft", f"{start} + {last}c")
+            self.textbox.mark_gravity("last_draft", "left")
+
     def replace_last_draft_with_final(self, text):
+        follow = self._is_scrolled_to_end()
         self.textbox.configure(state="normal")
-        
+        self._apply_final(text)
+        if follow:
+            self.textbox.see(ctk.END)
+        self.textbox.configure(state="disabled")
+
+    def _apply_final(self, text):
+        """Swap the last draft line for the timestamped final; caller holds state normal"""
         # Check if last line is draft
         # This is tricky in Tkinter without strict line management
         # Simplified: Just append Final with a timestamp like a chat
         
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         final_line = f"[{timestamp}] {text}\n"
         
         # Delete the last "Draft" line if possible? 
         # A simple approach: Just print Final text clearly.
         # User requested accuracy.
         
-        # Search for last [Draft] and delete it?
-        # Let's search back from end
-        last_index = self.textbox.search("[Draft]", "end-1c", backwards=True)
+        # Use the tracked draft mark; search back from end only when it is gone
+        if "last_draft" in self.textbox.mark_names():
+            last_index = self.textbox.index("last_draft")
+            self.textbox.mark_unset("last_draft")
+        else:
+            last_index = self.textbox.search("[Draft]", "end-1c", backwards=True)
         if last_index:
             line_end = self.textbox.index(f"{last_index} lineend + 1c")
+            self._word_count -= len(self._drop_last_draft_chunk().split())
             self.textbox.delete(last_index, line_end)
         
         self.textbox.insert(ctk.END, final_line, "black")
-        self.textbox.see(ctk.END)
-        self.textbox.configure(state="disabled")
+        self._transcript_chunks.append(final_line)
+        self._word_count += len(final_line.split())
 
     def clear_text(self):
         self.textbox.configure(state="normal")
         self.textbox.delete("1.0", ctk.END)
+        if "last_draft" in self.textbox.mark_names():
+            self.textbox.mark_unset("last_draft")
         self.textbox.configure(state="disabled")
+        self._word_count = 0
+        self._transcript_chunks = []
 
     def save_text(self):
-        text = self.textbox.get("1.0", ctk.END)
+        from tkinter import filedialog
+        text = self.get_transcript()
         filename = filedialog.asksaveasfilename(defaultextension=".txt")
         if filename:
+            threading.Thread(target=self._save_worker, args=(filename, text), daemon=True).start()
+
+    def _save_worker(self, filename, text):
+        """Write the transcript off the Tk thread and report back via after()"""
+        from tkinter import messagebox
+        try:
             with open(filename, "w") as f:
                 f.write(text)
+            self.after(0, lambda: messagebox.showinfo("Saved", f"Transcript saved to {filename}"))
+        except Exception as e:
+            self.after(0, lambda e=e: messagebox.showerror("Save Error", str(e)))
 
 if __name__ == "__main__":
     # Create a dummy root for standalone execution
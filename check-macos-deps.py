@@ -5,10 +5,18 @@ Run this before installing NoteForge to ensure your system is ready.
 """
 
 import sys
+import shutil
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, List
 
+# platform lookups are captured once; mac_ver() reads system files each call
+_MACHINE = platform.machine()
+_MAC_VER = platform.mac_ver()[0]
+_SYS = platform.system()
+_REL = platform.release()
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -59,6 +67,8 @@ def check_python_version() -> Tuple[bool, str]:
 
 def check_xcode_tools() -> Tuple[bool, str]:
     """Check if Xcode Command Line Tools are installed."""
+    if shutil.which('xcode-select') is None:
+        return False, "Not installed"
     try:
         result = subprocess.run(
             ['xcode-select', '-p'],
@@ -76,6 +86,8 @@ def check_xcode_tools() -> Tuple[bool, str]:
 
 def check_homebrew() -> Tuple[bool, str]:
     """Check if Homebrew is installed."""
+    if shutil.which('brew') is None:
+        return False, "Not installed"
     try:
         result = subprocess.run(
             ['brew', '--version'],
@@ -101,6 +113,28 @@ def check_system_deps() -> Tuple[bool, List[str]]:
         ('llvm', 'LLVM (compiler toolchain)'),
     ]
     
+    # Without pkg-config nothing can be verified; skip the doomed forks
+    if shutil.which('pkg-config') is None:
+        return False, [description for _, description in deps]
+    
+    # One pkg-config call for all packages; --print-errors names the missing ones
+    try:
+        result = subprocess.run(
+            ['pkg-config', '--print-errors', '--exists'] + [dep for dep, _ in deps],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            return True, []
+        missing = [description for dep, description in deps
+                   if f"Package '{dep}'" in result.stderr or f"Package {dep} " in result.stderr]
+        if missing:
+            return False, missing
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False, [description for _, description in deps]
+    
+    # Unrecognised error output: fall back to asking per package
     for dep, description in deps:
         try:
             result = subprocess.run(
@@ -119,7 +153,7 @@ def check_system_deps() -> Tuple[bool, List[str]]:
 
 def check_architecture() -> Tuple[bool, str]:
     """Check system architecture."""
-    machine = platform.machine()
+    machine = _MACHINE
     
     if machine == 'arm64':
         return True, f"Apple Silicon ({machine}) - Excellent for ML"
@@ -131,7 +165,7 @@ def check_architecture() -> Tuple[bool, str]:
 
 def check_macos_version() -> Tuple[bool, str]:
     """Check macOS version."""
-    version = platform.mac_ver()[0]
+    version = _MAC_VER
     major = int(version.split('.')[0])
     
     if major >= 11:  # Big Sur and later
@@ -145,7 +179,6 @@ def check_macos_version() -> Tuple[bool, str]:
 def check_disk_space() -> Tuple[bool, str]:
     """Check available disk space."""
     try:
-        import shutil
         total, used, free = shutil.disk_usage('.')
         free_gb = free / (1024**3)
         
@@ -166,29 +199,36 @@ def main():
     print(f"\n{Colors.BLUE}{Colors.BOLD}🍎 NoteForge Pre-flight Check{Colors.END}")
     print("=" * 60)
     print(f"Python: {sys.version.split()[0]}")
-    print(f"Platform: {platform.system()} {platform.release()}")
+    print(f"Platform: {_SYS} {_REL}")
     
     all_checks_passed = True
     
+    # The checks are independent and mostly wait on subprocesses, so run them
+    # all at once and print the results in the usual order afterwards
+    checks = [check_python_version, check_macos_version, check_architecture,
+              check_xcode_tools, check_homebrew, check_system_deps, check_disk_space]
+    with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+        futures = {fn: ex.submit(fn) for fn in checks}
+    
     # Python Version
     print_header("Python Installation")
-    passed, message = check_python_version()
+    passed, message = futures[check_python_version].result()
     print_status("Python Version", "OK" if passed else "ERROR", message)
     if not passed:
         all_checks_passed = False
     
     # macOS Version
     print_header("macOS System")
-    passed, message = check_macos_version()
+    passed, message = futures[check_macos_version].result()
     print_status("macOS Version", "OK" if passed else "WARNING", message)
     
     # Architecture
-    passed, message = check_architecture()
+    passed, message = futures[check_architecture].result()
     print_status("Architecture", "OK" if passed else "WARNING", message)
     
     # Xcode Tools
     print_header("Developer Tools")
-    passed, message = check_xcode_tools()
+    passed, message = futures[check_xcode_tools].result()
     print_status("Xcode Command Line Tools", "OK" if passed else "ERROR", message)
     if not passed:
         all_checks_passed = False
@@ -196,14 +236,14 @@ def main():
     
     # Homebrew
     print_header("Package Manager")
-    passed, message = check_homebrew()
+    passed, message = futures[check_homebrew].result()
     print_status("Homebrew", "OK" if passed else "WARNING", message)
     if not passed:
         print("     Install with: /bin/bash -c \"\$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"")
     
     # System Dependencies
     print_header("System Dependencies")
-    passed, missing = check_system_deps()
+    passed, missing = futures[check_system_deps].result()
     if passed:
         print_status("Dependencies", "OK", "All required dependencies installed")
     else:
@@ -212,7 +252,7 @@ def main():
     
     # Disk Space
     print_header("Disk Space")
-    passed, message = check_disk_space()
+    passed, message = futures[check_disk_space].result()
     print_status("Free Space", "OK" if passed else "WARNING", message)
     
     # Summary
@@ -1,44 +1,122 @@
 import json
 import os
-import shutil
-import platform
-import subprocess
-import requests
-import zipfile
+# requests, zipfile, whisper (which pulls in torch) and the file/hash helpers
+# are imported inside the functions that use them, so reading settings stays cheap
+
 try:
-    import whisper
+    import orjson # Optional C JSON codec for config.json
+    _json_loads = orjson.loads
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
-    # We'll handle this in the app if it fails, but for now we need a placeholder or just re-raise with better msg
-    whisper = None
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
 
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), "config.json")
 
+WHISPER_MODEL_SIZES = frozenset({"tiny", "base", "small", "medium", "large", "large-v2", "large-v3"})
+
 DEFAULT_SETTINGS = {
     "whisper_model_size": "base",
     "bart_model_name": "facebook/bart-large-cnn",
 }
 
+# Set by cancel_downloads() when the app is closing; the Vosk download and
+# extraction loops check it between blocks/members and stop cleanly
+_CANCEL = {"set": False}
+
+class DownloadCancelled(Exception):
+    """Raised inside model download/extraction once cancel_downloads() was called."""
+
+def cancel_downloads():
+    """Ask running model downloads to stop at their next block."""
+    _CANCEL["set"] = True
+
+def _check_cancel():
+    if _CANCEL["set"]:
+        raise DownloadCancelled("Model download cancelled.")
+
+def _run_uncancellable(fn, *args, **kwargs):
+    """Run a download that has no cancel hook (whisper, huggingface_hub) on a daemon thread.
+
+    The caller waits for it, but raises DownloadCancelled as soon as
+    cancel_downloads() is called, so closing the app isn't held up by a
+    multi-GB transfer; the daemon thread simply ends with the process.
+    whisper re-checks its checkpoint's SHA-256 when loading and
+    huggingface_hub writes to .incomplete files, so an abandoned download
+    is never taken for a finished one.
+    """
+    import threading
+    result = {}
+
+    def target():
+        try:
+            result["value"] = fn(*args, **kwargs)
+        except BaseException as e:
+            result["error"] = e
+
+    t = threading.Thread(target=target, daemon=True)
+    t.start()
+    while t.is_alive():
+        t.join(0.2)
+        _check_cancel()
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+# Parsed config.json, reused while the file's (mtime_ns, size) is unchanged.
+# The size catches rewrites that land within the filesystem's mtime granularity
+_SETTINGS_CACHE = {"stat": None, "data": None}
+
+def _cached_settings():
+    """Shared, read-only view of the current settings."""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        return DEFAULT_SETTINGS
+    key = (st.st_mtime_ns, st.st_size)
+    if key == _SETTINGS_CACHE["stat"]:
+        return _SETTINGS_CACHE["data"]
+    with open(CONFIG_FILE, "rb") as f:
+        try:
+            settings = _json_loads(f.read())
+            data = {**DEFAULT_SETTINGS, **settings}
+        except ValueError: # json / orjson JSONDecodeError
+            print("Error reading config.json, using default settings.")
+            data = DEFAULT_SETTINGS
+    _SETTINGS_CACHE["stat"] = key
+    _SETTINGS_CACHE["data"] = data
+    return data
+
 def load_settings():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, "r") as f:
-            try:
-                settings = json.load(f)
-                return {**DEFAULT_SETTINGS, **settings}
-            except json.JSONDecodeError:
-                print("Error reading config.json, using default settings.")
-                return DEFAULT_SETTINGS
-    return DEFAULT_SETTINGS
+    return dict(_cached_settings()) # Copy so callers can't mutate the cache
 
 def save_settings(settings):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(settings, f, indent=4)
+    # Write a temp file and rename it over config.json, so a crash mid-write
+    # can't leave a truncated file that would load as defaults next start
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_json_dumps(settings))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_FILE)
+    # Warm the cache so the next get_setting doesn't re-read what we just wrote
+    st = os.stat(CONFIG_FILE)
+    _SETTINGS_CACHE["stat"] = (st.st_mtime_ns, st.st_size)
+    _SETTINGS_CACHE["data"] = {**DEFAULT_SETTINGS, **settings}
 
-def get_setting(key, default=None):
+def set_setting(key, value):
     settings = load_settings()
+    settings[key] = value
+    save_settings(settings)
+
+def get_setting(key, default=None):
+    settings = _cached_settings()
     # simple validation for whisper model size
     if key == "whisper_model_size":
         val = settings.get(key, DEFAULT_SETTINGS.get(key))
-        if val not in ["tiny", "base", "small", "medium", "large", "large-v2", "large-v3"]:
+        if val not in WHISPER_MODEL_SIZES:
             return "base"
         return val
         
@@ -59,21 +137,47 @@ def validate_config():
         save_settings(settings)
 
 
+# Whisper's default cache directory, resolved once at import. This logic is
+# based on common XDG_CACHE_HOME usage and Whisper's default behavior
+_IS_WINDOWS = os.name == "nt"
+_HOME = os.path.expanduser("~")
+if _IS_WINDOWS:
+    _WHISPER_CACHE = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.join(_HOME, "AppData", "Local"), "Whisper", "models")
+else: # Linux, macOS
+    _WHISPER_CACHE = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(_HOME, ".cache"), "whisper")
+
 def get_whisper_cache_dir():
-    # Attempt to find Whisper's default cache directory
-    # This logic is based on common XDG_CACHE_HOME usage and Whisper's default behavior
-    if platform.system() == "Windows":
-        return os.path.join(os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local"), "Whisper", "models")
-    else: # Linux, macOS
-        return os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "whisper")
+    return _WHISPER_CACHE
+
+# Resolved once at import. The directory containing this script is the
+# project root, and the Vosk model lives in its "model" folder
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+VOSK_MODEL_DIR = os.path.join(PROJECT_ROOT, "model")
+WHISPER_CACHE_DIR = get_whisper_cache_dir()
+VOSK_OK_SENTINEL = ".vosk-ok"
+
+# Verbose path/cache diagnostics for model downloads
+DEBUG = bool(os.environ.get("NOTEFORGE_DEBUG"))
+
+def _dir_nonempty(path):
+    """True/False for a non-empty/empty directory, None if it doesn't exist.
+
+    One scandir that stops at the first entry replaces exists() + listdir().
+    """
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return None
 
 def delete_models(whisper_model_size_to_delete=None):
+    import shutil
+
     success_vosk = False
     success_whisper = False
 
     # 1. Delete Vosk model (project root model directory)
-    # Use the directory containing this script as the project root
-    vosk_model_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "model")
+    vosk_model_dir = VOSK_MODEL_DIR
     if os.path.exists(vosk_model_dir):
         try:
             shutil.rmtree(vosk_model_dir)
@@ -89,7 +193,7 @@ def delete_models(whisper_model_size_to_delete=None):
     if whisper_model_size_to_delete is None:
         whisper_model_size_to_delete = get_setting("whisper_model_size")
     
-    whisper_cache_dir = get_whisper_cache_dir()
+    whisper_cache_dir = WHISPER_CACHE_DIR
     
     # Whisper model files are typically named e.g., 'medium.pt', 'large.pt'
     model_filename = f"{whisper_model_size_to_delete}.pt"
@@ -129,63 +233,244 @@ def delete_models(whisper_model_size_to_delete=None):
 
     return success_vosk and success_whisper and success_bart
 
+_COPY_BUFSIZE = 1 << 20 # 1 MiB per read/write while extracting
+
+def _extract_subfolder(zip_path, prefix, dest_dir):
+    """Extract the members under prefix into dest_dir, dropping the prefix.
+
+    Directories are created up front in one pass; file members are then
+    decompressed by a thread pool, each worker on its own ZipFile handle
+    since a ZipFile's file position can't be shared between readers.
+    """
+    import shutil
+    import zipfile
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    jobs = []
+    made_dirs = set()
+    # The central directory is parsed once here; members are then opened by
+    # ZipInfo (header offset), never looked up by name again
+    zip_ref = zipfile.ZipFile(zip_path, 'r')
+    local = threading.local()
+    handles = [zip_ref]
+    handles_lock = threading.Lock()
+    try:
+        for info in zip_ref.infolist():
+            if not info.filename.startswith(prefix) or info.is_dir():
+                continue
+            rel = os.path.normpath(info.filename[len(prefix):])
+            if os.path.isabs(rel) or rel.startswith(".."):
+                continue # Never write outside dest_dir
+            dest_path = os.path.join(dest_dir, rel)
+            parent = os.path.dirname(dest_path)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
+            jobs.append((info, dest_path))
+
+        # Refuse up front rather than fail halfway with a half-written model
+        needed = sum(info.file_size for info, _ in jobs)
+        free = shutil.disk_usage(dest_dir).free
+        if needed > free:
+            raise OSError(f"Insufficient disk space to extract model: need {needed >> 20} MiB, have {free >> 20} MiB.")
+
+        def extract(job, zf=None):
+            info, dest_path = job
+            if zf is None:
+                zf = getattr(local, "zf", None)
+                if zf is None:
+                    zf = local.zf = zipfile.ZipFile(zip_path, 'r')
+                    with handles_lock:
+                        handles.append(zf)
+            _check_cancel()
+            # No flush/fsync per file; OS writeback handles it
+            _copy_member(zf, info, dest_path)
+
+        # Every extra worker re-reads the central directory for its own handle,
+        # so never start more workers than there are files
+        workers = min(8, os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            for job in jobs:
+                extract(job, zip_ref)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                for _ in ex.map(extract, jobs):
+                    pass # Re-raises the first worker error
+    finally:
+        for zf in handles:
+            zf.close()
+
+def _copy_member(zf, info, dest_path):
+    """Write one member to dest_path; small ones in a single read/write.
+
+    Both paths go through ZipExtFile, so every member is CRC-checked.
+    """
+    import shutil
+    if info.file_size <= _COPY_BUFSIZE:
+        data = zf.read(info)
+        with open(dest_path, 'wb') as target:
+            target.write(data)
+        return
+    with zf.open(info) as source, open(dest_path, 'wb') as target:
+        shutil.copyfileobj(source, target, _COPY_BUFSIZE)
+
+_SESSION = None
+
+def _session():
+    """Shared keep-alive HTTP session with retries on transient gateway errors."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        _SESSION = requests.Session()
+        _SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])))
+        # Model archives are already compressed; don't let a proxy/CDN gzip
+        # them again (it would also break Range offsets and length checks)
+        _SESSION.headers["Accept-Encoding"] = "identity"
+    return _SESSION
+
+# Pin to the published archive's digest to enforce it; None only checks the length
+VOSK_MODEL_SHA256 = None
+
+def _download_vosk_zip(url, zip_path, progress_callback=None):
+    """Stream url into zip_path, hashing each chunk as it is written when
+    VOSK_MODEL_SHA256 is pinned.
+
+    A partial zip_path left by an interrupted run is resumed with an HTTP
+    Range request. Raises ConnectionError (after deleting zip_path) if the
+    size or SHA-256 doesn't match.
+    """
+    import hashlib
+
+    # Without a pinned digest nothing is compared, so don't hash (or re-read
+    # up to ~1.8 GB of a resumed file) at all
+    h = hashlib.sha256() if VOSK_MODEL_SHA256 else None # OpenSSL-backed
+    have = os.path.getsize(zip_path) if os.path.exists(zip_path) else 0
+    headers = {"Range": f"bytes={have}-"} if have else {}
+    with _session().get(url, stream=True, timeout=(10, 60), headers=headers) as r:
+        if r.status_code == 416:
+            # Nothing left to fetch: the previous session finished the file
+            total_size_in_bytes = progress = have
+            if h is not None:
+                _hash_file(zip_path, h)
+        else:
+            r.raise_for_status()
+            if r.status_code == 206:
+                # Server honoured the Range: append, and hash what is already on disk
+                progress = have
+                total_size_in_bytes = have + int(r.headers.get('content-length', 0))
+                if h is not None:
+                    _hash_file(zip_path, h)
+                mode = 'ab'
+            else:
+                # 200: full body; start the file over
+                progress = 0
+                total_size_in_bytes = int(r.headers.get('content-length', 0))
+                mode = 'wb'
+            _stream_to(r, zip_path, mode, h, progress, total_size_in_bytes, progress_callback)
+            progress = os.path.getsize(zip_path)
+
+    try:
+        if total_size_in_bytes and progress != total_size_in_bytes:
+            raise ConnectionError(f"Download incomplete: {progress} of {total_size_in_bytes} bytes")
+        if h is not None and h.hexdigest() != VOSK_MODEL_SHA256:
+            raise ConnectionError(f"Download corrupt: sha256 {h.hexdigest()}")
+    except ConnectionError:
+        os.remove(zip_path) # Don't resume from bad bytes
+        raise
+
+def _hash_file(path, h):
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+
+def _stream_to(r, zip_path, mode, h, progress, total_size_in_bytes, progress_callback):
+    """Copy the response body into zip_path, feeding h (if any) and progress_callback."""
+    import time
+
+    block_size = 1024 * 1024 # 1 Mebibyte
+    last_pct = 0.0
+    last_cb = time.monotonic()
+    r.raw.decode_content = True # Same bytes iter_content would yield
+    with open(zip_path, mode) as f:
+        # Read the raw stream directly; skips iter_content's generator layer
+        while True:
+            _check_cancel()
+            chunk = r.raw.read(block_size)
+            if not chunk:
+                break
+            f.write(chunk)
+            if h is not None:
+                h.update(chunk)
+            progress += len(chunk)
+            if progress_callback and total_size_in_bytes > 0:
+                percentage = 0.1 + (progress / total_size_in_bytes) * 0.4 # Vosk is 10-50%
+                # Report every 1% or 100 ms at most, to keep UI/queue traffic low
+                now = time.monotonic()
+                if percentage - last_pct >= 0.01 or now - last_cb >= 0.1:
+                    last_pct = percentage
+                    last_cb = now
+                    progress_callback(f"Downloading Vosk model... {int(percentage*100)}%", percentage)
+
 def download_models(progress_callback=None):
     """
     Ensures Vosk and Whisper models are present. Downloads them if not found.
     progress_callback: A function to call with (message, percentage) for UI updates.
     """
+    import shutil
     
     # 1. Vosk Model Download
-    # Use the directory containing this script as the project root
-    vosk_model_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "model")
+    vosk_model_dir = VOSK_MODEL_DIR
     VOSK_MODEL_NAME = "vosk-model-en-us-0.22"
     VOSK_MODEL_URL = f"https://alphacephei.com/vosk/models/{VOSK_MODEL_NAME}.zip"
+    # Written only after a complete extraction, so a partial directory left by
+    # a failed run is never mistaken for a usable model
+    vosk_ok = os.path.join(vosk_model_dir, VOSK_OK_SENTINEL)
 
-    print(f"DEBUG: Vosk model directory: '{vosk_model_dir}'")
-    print(f"DEBUG: os.path.exists(vosk_model_dir): {os.path.exists(vosk_model_dir)}")
-    if os.path.exists(vosk_model_dir):
-        print(f"DEBUG: os.listdir(vosk_model_dir) is empty: {not bool(os.listdir(vosk_model_dir))}")
+    vosk_state = _dir_nonempty(vosk_model_dir)
+    if DEBUG:
+        print(f"DEBUG: Vosk model directory: '{vosk_model_dir}' (exists: {vosk_state is not None}, empty: {vosk_state is False})")
+
+    if vosk_state and not os.path.exists(vosk_ok) and all(os.path.isdir(os.path.join(vosk_model_dir, d)) for d in ("am", "conf", "graph")):
+        # Model extracted before the sentinel existed; adopt it rather than re-download
+        open(vosk_ok, "w").close()
 
-    if not os.path.exists(vosk_model_dir) or not os.listdir(vosk_model_dir):
-        print(f"Vosk model not found at {vosk_model_dir} or directory is empty. Downloading...")
+    if not os.path.exists(vosk_ok):
+        print(f"Vosk model not found at {vosk_model_dir} or incomplete. Downloading...")
         if progress_callback:
             progress_callback("Downloading Vosk model...", 0.1)
 
-        # Create the model directory if it doesn't exist
+        # Start from a clean model directory; anything here is a partial leftover
+        shutil.rmtree(vosk_model_dir, ignore_errors=True)
         os.makedirs(vosk_model_dir, exist_ok=True)
 
-        zip_path = os.path.join(vosk_model_dir, f"{VOSK_MODEL_NAME}.zip")
+        # The archive goes to a named file beside (not in) the model dir so each
+        # extraction worker can open its own ZipFile on it. The name is fixed so
+        # an interrupted download can be resumed by the next run
+        zip_path = os.path.join(PROJECT_ROOT, f"{VOSK_MODEL_NAME}.zip.part")
+        downloaded = False
         try:
-            with requests.get(VOSK_MODEL_URL, stream=True) as r:
-                r.raise_for_status()
-                total_size_in_bytes = int(r.headers.get('content-length', 0))
-                block_size = 8192 # 8 Kibibytes
-                progress = 0
-                with open(zip_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=block_size): 
-                        if progress_callback and total_size_in_bytes > 0:
-                            progress += len(chunk)
-                            percentage = 0.1 + (progress / total_size_in_bytes) * 0.4 # Vosk is 10-50%
-                            progress_callback(f"Downloading Vosk model... {int(percentage*100)}%", percentage)
-                        f.write(chunk)
+            # A truncated or corrupted archive gets one fresh attempt
+            for attempt in range(2):
+                try:
+                    _download_vosk_zip(VOSK_MODEL_URL, zip_path, progress_callback)
+                    break
+                except ConnectionError as e:
+                    if attempt:
+                        raise
+                    print(f"Vosk download failed verification ({e}). Retrying once...")
+            downloaded = True
             
             if progress_callback:
                 progress_callback("Extracting Vosk model...", 0.5)
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Vosk models are usually in a subfolder with the model name, extract directly into vosk_model_dir
-                for member in zip_ref.namelist():
-                    if member.startswith(f"{VOSK_MODEL_NAME}/"):
-                        # Extract the contents of the subfolder directly into vosk_model_dir
-                        # Adjust member path to remove the leading model name folder
-                        dest_path = os.path.join(vosk_model_dir, os.path.relpath(member, VOSK_MODEL_NAME))
-                        if not os.path.exists(os.path.dirname(dest_path)):
-                            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                        if not member.endswith('/'): # Avoid creating directories for empty folders
-                            with zip_ref.open(member) as source, open(dest_path, 'wb') as target:
-                                shutil.copyfileobj(source, target)
-            
-            # Clean up the zip file after extraction
+            # Vosk models are in a subfolder with the model name; its contents go
+            # straight into vosk_model_dir
+            _extract_subfolder(zip_path, f"{VOSK_MODEL_NAME}/", vosk_model_dir)
+            open(vosk_ok, "w").close()
             os.remove(zip_path)
+            
             print("Vosk model downloaded and extracted successfully.")
             if progress_callback:
                 progress_callback("Vosk model ready.", 0.5)
@@ -193,11 +478,12 @@ def download_models(progress_callback=None):
             print(f"Error downloading or extracting Vosk model: {e}")
             if progress_callback:
                 progress_callback(f"Error downloading Vosk: {e}", 0.5)
-            # Clean up partially downloaded/extracted files if an error occurs
-            if os.path.exists(zip_path):
+            # Clean up partially extracted files so the next run starts clean
+            shutil.rmtree(vosk_model_dir, ignore_errors=True)
+            # Keep a partial archive to resume from, but not one that failed to
+            # extract (a cancelled extraction's archive is still good)
+            if downloaded and os.path.exists(zip_path) and not isinstance(e, DownloadCancelled):
                 os.remove(zip_path)
-            if os.path.exists(vosk_model_dir) and not os.listdir(vosk_model_dir):
-                shutil.rmtree(vosk_model_dir) # Remove empty dir if extraction failed
             return False # Indicate failure
     else:
         print("Vosk model already present.")
@@ -205,9 +491,13 @@ def download_models(progress_callback=None):
             progress_callback("Vosk model ready.", 0.5)
 
 
+    # Don't start the Whisper/BART downloads once the app is closing
+    if _CANCEL["set"]:
+        return False
+
     # 2. Whisper Model Download
     current_whisper_size = get_setting("whisper_model_size")
-    whisper_cache_dir = get_whisper_cache_dir()
+    whisper_cache_dir = WHISPER_CACHE_DIR
     
     # Check for both standard and versioned filenames for Whisper models
     potential_whisper_model_paths = [
@@ -222,21 +512,32 @@ def download_models(progress_callback=None):
             found_whisper_model_path = p
             break
             
-    print(f"DEBUG: Whisper cache directory: '{whisper_cache_dir}'")
-    print(f"DEBUG: Potential Whisper model paths: {potential_whisper_model_paths}")
-    print(f"DEBUG: Found Whisper model path: '{found_whisper_model_path}'")
+    if DEBUG:
+        print(f"DEBUG: Whisper cache directory: '{whisper_cache_dir}'")
+        print(f"DEBUG: Potential Whisper model paths: {potential_whisper_model_paths}")
+        print(f"DEBUG: Found Whisper model path: '{found_whisper_model_path}'")
 
     if found_whisper_model_path is None:
         print(f"Whisper model '{current_whisper_size}' not found. Downloading...")
         if progress_callback:
             progress_callback(f"Downloading Whisper model '{current_whisper_size}'...", 0.6)
         try:
-            # whisper.load_model automatically downloads if not present
+            try:
+                import whisper
+            except ImportError:
+                whisper = None
             if whisper is None:
                 raise ImportError("The 'whisper' module is not installed. Please run 'pip install openai-whisper'.")
-            whisper.load_model(current_whisper_size, download_root=whisper_cache_dir)
+            if hasattr(whisper, "_download") and current_whisper_size in getattr(whisper, "_MODELS", {}):
+                # Fetch (and checksum) the checkpoint only; load_model would also
+                # build the torch model in RAM just to throw it away
+                _run_uncancellable(whisper._download, whisper._MODELS[current_whisper_size], whisper_cache_dir, False)
+            else:
+                # whisper.load_model automatically downloads if not present
+                _run_uncancellable(whisper.load_model, current_whisper_size, download_root=whisper_cache_dir)
             print(f"Whisper model '{current_whisper_size}' downloaded successfully.")
-            print(f"DEBUG: Contents of Whisper cache directory '{whisper_cache_dir}' after download: {os.listdir(whisper_cache_dir)}")
+            if DEBUG:
+                print(f"DEBUG: Contents of Whisper cache directory '{whisper_cache_dir}' after download: {os.listdir(whisper_cache_dir)}")
             if progress_callback:
                 progress_callback(f"Whisper model '{current_whisper_size}' ready.", 1.0)
         except Exception as e:
@@ -249,12 +550,15 @@ def download_models(progress_callback=None):
         if progress_callback:
             progress_callback(f"Whisper model '{current_whisper_size}' ready.", 1.0)
     
+    if _CANCEL["set"]:
+        return False
+
     # 3. BART Model Download
     bart_model_name = get_setting("bart_model_name", "facebook/bart-large-cnn")
     if progress_callback:
         progress_callback(f"Checking BART model '{bart_model_name}'...", 0.9)
     try:
-        from transformers import AutoConfig, pipeline
+        from transformers import AutoConfig
         try:
             # Check if model exists locally
             AutoConfig.from_pretrained(bart_model_name, local_files_only=True)
@@ -263,8 +567,15 @@ def download_models(progress_callback=None):
             print(f"BART model '{bart_model_name}' not found. Downloading...")
             if progress_callback:
                 progress_callback(f"Downloading BART model (this may take time)...", 0.9)
-            # This triggers download
-            pipeline("summarization", model=bart_model_name)
+            # Fetch the files into the HF cache without loading the weights.
+            # Only config/tokenizer files and one weight format: the repo also
+            # carries .bin, TF, Flax and Rust copies of the same weights
+            from huggingface_hub import snapshot_download
+            _run_uncancellable(
+                snapshot_download,
+                repo_id=bart_model_name,
+                allow_patterns=["*.json", "merges.txt", "vocab.json", "model.safetensors"],
+            )
             print(f"BART model '{bart_model_name}' downloaded successfully.")
         
         if progress_callback:
@@ -281,38 +592,31 @@ def clear_all_models():
     """
     Deletes all Vosk and Whisper models regardless of size.
     """
+    import shutil
     print("Attempting to clear all models...")
-    # Delete Vosk model (all versions if multiple existed, though currently only one is managed)
-    vosk_model_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "model")
-    if os.path.exists(vosk_model_dir):
-        try:
-            shutil.rmtree(vosk_model_dir)
-            print(f"Deleted Vosk model directory: {vosk_model_dir}")
-        except Exception as e:
-            print(f"Error deleting Vosk model directory {vosk_model_dir}: {e}")
-    else:
-        print(f"Vosk model directory not found at {vosk_model_dir}.")
-
-    # Delete all Whisper models in the cache directory
-    whisper_cache_dir = get_whisper_cache_dir()
-    if os.path.exists(whisper_cache_dir):
-        try:
-            # Delete the entire cache directory for Whisper
-            shutil.rmtree(whisper_cache_dir)
-            print(f"Deleted Whisper cache directory: {whisper_cache_dir}")
-        except Exception as e:
-            print(f"Error deleting Whisper cache directory {whisper_cache_dir}: {e}")
-    else:
-        print(f"Whisper cache directory not found at {whisper_cache_dir}.")
-
-    # Delete HuggingFace cache (for BART and others)
+    # Vosk model (all versions if multiple existed, though currently only one is managed),
+    # the whole Whisper cache, and the HuggingFace cache (for BART and others)
+    targets = [("Vosk model directory", VOSK_MODEL_DIR), ("Whisper cache directory", WHISPER_CACHE_DIR)]
     try:
         from huggingface_hub import constants
-        hf_cache_dir = constants.HF_HUB_CACHE
-        if os.path.exists(hf_cache_dir):
-            shutil.rmtree(hf_cache_dir)
-            print(f"Deleted HuggingFace cache: {hf_cache_dir}")
+        targets.append(("HuggingFace cache", constants.HF_HUB_CACHE))
     except Exception as e:
         print(f"Error clearing HuggingFace cache: {e}")
 
+    def remove(target):
+        label, path = target
+        if not os.path.exists(path):
+            print(f"{label} not found at {path}.")
+            return
+        try:
+            shutil.rmtree(path)
+            print(f"Deleted {label}: {path}")
+        except Exception as e:
+            print(f"Error deleting {label} {path}: {e}")
+
+    # The trees are independent, so overlap their unlink latency
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(targets)) as ex:
+        list(ex.map(remove, targets))
+
     return True
\ No newline at end of file
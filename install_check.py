@@ -6,10 +6,20 @@ Supports Windows, Linux, and macOS.
 """
 
 import sys
-import platform
+import importlib.util
 
+from macos_compat import get_platform_info
 
-def check_dependencies():
+
+def is_installed(module_name):
+    """Resolve the module's spec without running it (torch etc. take seconds to import)."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _check_dependencies(out):
     missing = []
     
     dependencies = [
@@ -35,74 +45,85 @@ def check_dependencies():
         ('webrtcvad', 'webrtcvad'),
     ]
     
-    print("🔍 Checking NoteForge dependencies...\n")
-    print(f"Platform: {platform.system()} {platform.release()}")
-    print(f"Architecture: {platform.machine()}")
-    print(f"Python: {platform.python_version()}\n")
+    info = get_platform_info()
+    is_macos = info['is_macos']
+    
+    out("🔍 Checking NoteForge dependencies...\n")
+    out(f"Platform: {info['system']} {info['release']}")
+    out(f"Architecture: {info['machine']}")
+    out(f"Python: {info['python_version']}\n")
     
     # Check core dependencies
     for module_name, package_name in dependencies:
-        try:
-            __import__(module_name)
-            print(f"✅ {package_name}")
-        except ImportError:
-            print(f"❌ {package_name} - MISSING")
+        if is_installed(module_name):
+            out(f"✅ {package_name}")
+        else:
+            out(f"❌ {package_name} - MISSING")
             missing.append(package_name)
     
     # Check macOS-specific optional dependencies
-    if platform.system() == "Darwin":
-        print(f"\n🍎 macOS Optional Dependencies:")
+    if is_macos:
+        out(f"\n🍎 macOS Optional Dependencies:")
         for module_name, package_name in macos_optional:
-            try:
-                __import__(module_name)
-                print(f"✅ {package_name} (optional)")
-            except ImportError:
-                print(f"⚠️  {package_name} (optional) - NOT INSTALLED")
-                print(f"    Voice Activity Detection will use fallback mode")
+            if is_installed(module_name):
+                out(f"✅ {package_name} (optional)")
+            else:
+                out(f"⚠️  {package_name} (optional) - NOT INSTALLED")
+                out(f"    Voice Activity Detection will use fallback mode")
     
-    print()
+    out("")
     
     if missing:
-        print(f"⚠️  {len(missing)} dependencies are missing!")
-        print("\nTo install missing dependencies:")
+        out(f"⚠️  {len(missing)} dependencies are missing!")
+        out("\nTo install missing dependencies:")
         
-        if platform.system() == "Darwin":
-            print("  🍎 macOS detected. Use:")
-            print("    source venv/bin/activate")
-            print("    pip install -r requirements-macos.txt")
-            print("\n  Or run the automated installer:")
-            print("    chmod +x install-macos.sh")
-            print("    ./install-macos.sh")
+        if is_macos:
+            out("  🍎 macOS detected. Use:")
+            out("    source venv/bin/activate")
+            out("    pip install -r requirements-macos.txt")
+            out("\n  Or run the automated installer:")
+            out("    chmod +x install-macos.sh")
+            out("    ./install-macos.sh")
         else:
-            print("  pip install -r requirements.txt")
+            out("  pip install -r requirements.txt")
         
-        print("\nOr install individually:")
+        out("\nOr install individually:")
         for pkg in missing:
-            print(f"  pip install {pkg}")
+            out(f"  pip install {pkg}")
         
-        print("\n💡 Tip: Run 'python check-macos-deps.py' (macOS) to check system requirements")
+        out("\n💡 Tip: Run 'python check-macos-deps.py' (macOS) to check system requirements")
         return False
     else:
-        print("✅ All dependencies installed!")
+        out("✅ All dependencies installed!")
         
         # Check PyTorch backend availability
-        if platform.system() == "Darwin":
+        if is_macos:
             try:
                 import torch
                 if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-                    print("✅ PyTorch MPS backend available (Apple Silicon optimized)")
+                    out("✅ PyTorch MPS backend available (Apple Silicon optimized)")
                 else:
-                    print("ℹ️  PyTorch using CPU backend")
+                    out("ℹ️  PyTorch using CPU backend")
             except:
                 pass
         
-        print("\n🚀 You can now run:")
-        if platform.system() == "Darwin":
-            print("  source venv/bin/activate")
-        print("  python main.py")
+        out("\n🚀 You can now run:")
+        if is_macos:
+            out("  source venv/bin/activate")
+        out("  python main.py")
         return True
 
 
+def check_dependencies():
+    # Collect the report and write it once; each print is a separate
+    # encode + write (and flush on Windows consoles)
+    lines = []
+    ok = _check_dependencies(lines.append)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return ok
+
+
 if __name__ == "__main__":
     success = check_dependencies()
     sys.exit(0 if success else 1)
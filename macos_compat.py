@@ -8,29 +8,38 @@ import sys
 import platform
 import os
 import subprocess
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform_info() -> dict:
     """
     Get detailed platform information.
     
+    Computed once per process (platform.processor() shells out on macOS);
+    treat the returned dictionary as read-only.
+    
     Returns:
         Dictionary containing platform details
     """
+    system = platform.system()
+    machine = platform.machine()
     return {
-        'system': platform.system(),
+        'system': system,
         'release': platform.release(),
         'version': platform.version(),
-        'machine': platform.machine(),
+        'machine': machine,
         'processor': platform.processor(),
         'python_version': platform.python_version(),
-        'is_macos': platform.system() == 'Darwin',
-        'is_apple_silicon': platform.machine() == 'arm64',
-        'is_intel': platform.machine() == 'x86_64',
+        'is_macos': system == 'Darwin',
+        'is_apple_silicon': machine == 'arm64',
+        'is_intel': machine == 'x86_64',
     }
 
 
+@functools.lru_cache(maxsize=1)
 def check_python_version() -> Tuple[bool, str]:
     """
     Check if Python version is compatible with NoteForge.
@@ -58,44 +67,31 @@ def check_macos_deps() -> dict:
     Returns:
         Dictionary with dependency status
     """
-    deps = {
-        'xcode_tools': False,
-        'homebrew': False,
-        'portaudio': False,
-        'llvm': False,
-    }
-    
-    # Check Xcode Command Line Tools
-    try:
-        result = subprocess.run(['xcode-select', '-p'], capture_output=True, text=True)
-        deps['xcode_tools'] = result.returncode == 0
-    except FileNotFoundError:
-        deps['xcode_tools'] = False
-    
-    # Check Homebrew
-    try:
-        result = subprocess.run(['brew', '--version'], capture_output=True, text=True)
-        deps['homebrew'] = result.returncode == 0
-    except (FileNotFoundError, subprocess.SubprocessError):
-        deps['homebrew'] = False
+    probes = [
+        ('xcode_tools', ['xcode-select', '-p']),          # Xcode Command Line Tools
+        ('homebrew', ['brew', '--version']),
+        ('portaudio', ['pkg-config', '--exists', 'portaudio']),
+        ('llvm', ['llvm-config', '--version']),
+    ]
     
-    # Check PortAudio
-    try:
-        result = subprocess.run(['pkg-config', '--exists', 'portaudio'], capture_output=True, text=True)
-        deps['portaudio'] = result.returncode == 0
-    except (FileNotFoundError, subprocess.SubprocessError):
-        deps['portaudio'] = False
+    def probe(argv):
+        # Only the exit status matters, so no pipes to create and drain
+        try:
+            result = subprocess.run(argv, stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return result.returncode == 0
+        except (FileNotFoundError, subprocess.SubprocessError):
+            return False
     
-    # Check LLVM
-    try:
-        result = subprocess.run(['llvm-config', '--version'], capture_output=True, text=True)
-        deps['llvm'] = result.returncode == 0
-    except (FileNotFoundError, subprocess.SubprocessError):
-        deps['llvm'] = False
+    # The probes are independent; run them side by side
+    with ThreadPoolExecutor(max_workers=len(probes)) as ex:
+        futures = {key: ex.submit(probe, argv) for key, argv in probes}
+    deps = {key: future.result() for key, future in futures.items()}
     
     return deps
 
 
+@functools.lru_cache(maxsize=1)
 def get_macos_version() -> Optional[str]:
     """
     Get macOS version name (e.g., "Ventura", "Monterey").
@@ -117,6 +113,7 @@ def get_macos_version() -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_recommended_pytorch_url() -> str:
     """
     Get the recommended PyTorch installation URL for current platform.
@@ -230,12 +227,16 @@ def get_installation_instructions() -> dict:
         }
 
 
-def validate_installation() -> Tuple[bool, list]:
+@functools.lru_cache(maxsize=1)
+def validate_installation() -> Tuple[bool, tuple]:
     """
     Run a comprehensive installation validation.
     
+    The result is cached for the process; call invalidate_validation_cache()
+    after installing something to re-run it.
+    
     Returns:
-        Tuple of (is_valid, list of issues)
+        Tuple of (is_valid, tuple of issues)
     """
     issues = []
     
@@ -245,14 +246,17 @@ def validate_installation() -> Tuple[bool, list]:
         issues.append(f"Python: {message}")
     
     # Check macOS dependencies
-    if platform.system() == 'Darwin':
+    if get_platform_info()['is_macos']:
         deps = check_macos_deps()
         if not deps['xcode_tools']:
             issues.append("Xcode Command Line Tools not installed")
         if not deps['homebrew']:
             issues.append("Homebrew not installed")
     
-    # Check critical imports
+    # Check critical imports; is_installed only locates the package, since
+    # importing torch/whisper takes seconds. Imported here because
+    # install_check itself imports this module
+    from install_check import is_installed
     critical_imports = [
         ('customtkinter', 'GUI framework'),
         ('sounddevice', 'Audio processing'),
@@ -262,9 +266,12 @@ def validate_installation() -> Tuple[bool, list]:
     ]
     
     for module, description in critical_imports:
-        try:
-            __import__(module)
-        except ImportError:
+        if not is_installed(module):
             issues.append(f"{module} ({description}) not installed")
     
-    return len(issues) == 0, issues
+    return len(issues) == 0, tuple(issues)
+
+
+def invalidate_validation_cache():
+    """Forget the cached validate_installation() result."""
+    validate_installation.cache_clear()
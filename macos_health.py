@@ -3,6 +3,16 @@
 import platform
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _probe(argv):
+    """True if the command exits 0; output is discarded."""
+    try:
+        res = subprocess.run(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return res.returncode == 0
+    except Exception:
+        return False
 
 
 def main():
@@ -11,20 +21,19 @@ def main():
     print("Platform:", platform.system(), platform.release())
     print("Python:", platform.python_version())
 
+    # Start the tool probes together; results are printed in order below
+    ex = ThreadPoolExecutor(max_workers=3)
+    xcode_f = ex.submit(_probe, ["xcode-select", "-p"])
+    brew_f = ex.submit(_probe, ["brew", "--version"])
+    pa_f = ex.submit(_probe, ["pkg-config", "--exists", "portaudio"])
+    ex.shutdown(wait=False)
+
     # Xcode Command Line Tools
-    try:
-        res = subprocess.run(["xcode-select", "-p"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        xcode_ok = (res.returncode == 0)
-    except Exception:
-        xcode_ok = False
+    xcode_ok = xcode_f.result()
     print("Xcode Command Line Tools:", "OK" if xcode_ok else "Missing")
 
     # Homebrew
-    try:
-        res = subprocess.run(["brew", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        brew_ok = (res.returncode == 0)
-    except Exception:
-        brew_ok = False
+    brew_ok = brew_f.result()
     print("Homebrew:", "OK" if brew_ok else "Missing")
 
     # VosK
@@ -38,11 +47,7 @@ def main():
     print("VosK:", vosk_ver if vosk_ok else "Missing")
 
     # PortAudio
-    try:
-        subprocess.run(["pkg-config", "--exists", "portaudio"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        pa_ok = True
-    except Exception:
-        pa_ok = False
+    pa_ok = pa_f.result()
     print("PortAudio:", "OK" if pa_ok else "Missing")
 
     # Tkinter availability
@@ -2,11 +2,10 @@ import customtkinter as ctk
 import os
 import sys
 import platform
-from PIL import Image
 import config_manager
 import queue 
-import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Import Mac Compatibility Module ---
 try:
@@ -22,21 +21,41 @@ try:
 except ImportError:
     MACOS_COMPAT_AVAILABLE = False
 
-# --- Import Modules ---
-try:
-    from app import HybridTranscriberApp
-except ImportError as e:
-    print(f"Error importing app: {e}")
-    HybridTranscriberApp = None
+# --- Lazily Imported Modules ---
+# app and study_gui pull in torch, whisper, vosk and transformers, so they are
+# imported on first use instead of before the main menu can appear
+HybridTranscriberApp = None
+StudyAssistantGUI = None
 
-try:
-    from study_gui import StudyAssistantGUI
-except ImportError as e:
-    print(f"Error importing study gui: {e}")
-    StudyAssistantGUI = None
 
-# Check if critical modules failed to import
-if HybridTranscriberApp is None or StudyAssistantGUI is None:
+def _lazy_load_app():
+    global HybridTranscriberApp
+    if HybridTranscriberApp is None:
+        try:
+            from app import HybridTranscriberApp as _App
+        except ImportError as e:
+            print(f"Error importing app: {e}")
+            _report_missing_dependencies()
+            return None
+        HybridTranscriberApp = _App
+    return HybridTranscriberApp
+
+
+def _lazy_load_study_gui():
+    global StudyAssistantGUI
+    if StudyAssistantGUI is None:
+        try:
+            from study_gui import StudyAssistantGUI as _Gui
+        except ImportError as e:
+            print(f"Error importing study gui: {e}")
+            _report_missing_dependencies()
+            return None
+        StudyAssistantGUI = _Gui
+    return StudyAssistantGUI
+
+
+def _report_missing_dependencies():
+    """Print install help after a critical module failed to import."""
     print("\n⚠️  MISSING DEPENDENCIES DETECTED")
     print("Please ensure all dependencies are installed:")
     
@@ -84,6 +103,8 @@ if HybridTranscriberApp is None or StudyAssistantGUI is None:
     print("\nTo verify installation, run:")
     print("  python -c \"import torch; import whisper; import vosk; import pptx; print('✅ All dependencies installed!')\"")
     print()
+
+
 class MainMenuApp(ctk.CTk): 
     def __init__(self):
         super().__init__()
@@ -106,9 +127,31 @@ class MainMenuApp(ctk.CTk):
 
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue") 
+
+        # Shared font objects: Tk resolves each once instead of per widget,
+        # and the settings window reuses them every time it opens
+        self._f_title = ctk.CTkFont(family="Segoe UI", size=42, weight="bold")
+        self._f_loading = ctk.CTkFont(family="Segoe UI", size=20, weight="bold")
+        self._f_btn = ctk.CTkFont(family="Segoe UI", size=16, weight="bold")
+        self._f_subtitle = ctk.CTkFont(family="Segoe UI", size=16)
+        self._f_label = ctk.CTkFont(family="Segoe UI", size=14, weight="bold")
+        self._f_body = ctk.CTkFont(family="Segoe UI", size=14)
+        self._f_small = ctk.CTkFont(family="Segoe UI", size=12)
         
         self.current_child = None
         self.gui_update_queue = queue.Queue()
+        # A threaded Tcl lets workers post a virtual event to wake the Tk
+        # thread; otherwise fall back to polling the queue
+        try:
+            self._event_wake = self.tk.getvar("tcl_platform(threaded)") in ("1", 1, True)
+        except Exception:
+            self._event_wake = False
+        self.bind("<<ModelProgress>>", self._drain_progress_queue)
+        # Model download/delete work runs here, never on the Tk thread
+        self.bg_exec = ThreadPoolExecutor(max_workers=2, thread_name_prefix="models")
+        self.settings_queue = queue.Queue()
+        self._settings_pending = 0 # Settings tasks not yet finished; polling stops at zero
+        self.protocol("WM_DELETE_WINDOW", self.exit_app)
 
         # Start cleanly with the Loading UI
         self.init_loading_ui()
@@ -137,7 +180,7 @@ class MainMenuApp(ctk.CTk):
         self.loading_label = ctk.CTkLabel(
             self.loading_frame, 
             text="Checking models...", 
-            font=("Segoe UI", 20, "bold"),
+            font=self._f_loading,
             text_color="#F0C38E"
         )
         self.loading_label.pack(pady=(0, 20))
@@ -148,22 +191,46 @@ class MainMenuApp(ctk.CTk):
 
     def start_model_download(self):
         """Starts the background thread for downloading models."""
+        # Each update is a Tk configure round-trip, so only forward progress
+        # on a new message, a 0.5% step, or every 100 ms
+        last = [0.0, -1.0, None] # time, percentage, message
+
+        def throttled_update(message, percentage):
+            now = time.monotonic()
+            if (message != last[2] or percentage >= 1.0 or percentage < last[1]
+                    or percentage - last[1] >= 0.005 or now - last[0] >= 0.1):
+                last[:] = [now, percentage, message]
+                self.queue_gui_update(message, percentage)
+
         def download_thread_target():
             # Pass our queue-based callback to the config manager logic
-            success = config_manager.download_models(progress_callback=self.queue_gui_update)
+            success = config_manager.download_models(progress_callback=throttled_update)
             # Signal completion via queue
             self.queue_gui_update("DONE", 1.0 if success else -1.0)
 
-        threading.Thread(target=download_thread_target, daemon=True).start()
-        # Start polling the queue
-        self.check_download_queue()
+        self.bg_exec.submit(download_thread_target)
+        if self._event_wake:
+            # Catches anything queued before mainloop could take events
+            self.after(0, self._drain_progress_queue)
+        else:
+            # Start polling the queue
+            self.check_download_queue()
 
     def queue_gui_update(self, message, percentage):
         """Callback for the download thread to enqueue updates."""
         self.gui_update_queue.put((message, percentage))
-
-    def check_download_queue(self):
-        """Polls the queue for updates on the main thread."""
+        if self._event_wake:
+            try:
+                self.event_generate("<<ModelProgress>>", when="tail")
+            except Exception:
+                pass # Window gone, or mainloop not running yet
+
+    def _drain_progress_queue(self, event=None):
+        """Applies queued download updates on the main thread; True once DONE is seen.
+
+        Only the newest progress item is drawn; older ones are already stale.
+        """
+        latest = None
         try:
             while True:
                 message, percentage = self.gui_update_queue.get_nowait()
@@ -173,14 +240,24 @@ class MainMenuApp(ctk.CTk):
                         self.transition_to_main_menu()
                     else:
                         self.loading_label.configure(text="Model download failed. Check console.", text_color="#F63049")
-                    return # Stop polling if done
+                    return True
 
-                # Update UI
-                self.loading_label.configure(text=message)
-                self.loading_progress.set(percentage)
+                latest = (message, percentage)
                 
         except queue.Empty:
             pass
+
+        if latest is not None:
+            # Update UI
+            message, percentage = latest
+            self.loading_label.configure(text=message)
+            self.loading_progress.set(percentage)
+        return False
+
+    def check_download_queue(self):
+        """Polls the queue for updates when Tcl can't be woken from other threads."""
+        if self._drain_progress_queue():
+            return # Stop polling if done
         
         # Schedule next check
         self.after(50, self.check_download_queue)
@@ -200,7 +277,7 @@ class MainMenuApp(ctk.CTk):
         self.title_label = ctk.CTkLabel(
             self.main_bg, 
             text="⚡ NOTEFORGE", 
-            font=("Segoe UI", 42, "bold"),
+            font=self._f_title,
             text_color="#F1AA9B",
             fg_color="transparent"
         )
@@ -209,7 +286,7 @@ class MainMenuApp(ctk.CTk):
         self.subtitle_label = ctk.CTkLabel(
             self.main_bg,
             text="Real-Time Transcription & Intelligent Note Summarization",
-            font=("Segoe UI", 16),
+            font=self._f_subtitle,
             text_color="gray",
             fg_color="transparent"
         )
@@ -218,7 +295,7 @@ class MainMenuApp(ctk.CTk):
         # --- 3. BUTTONS AREA ---
         btn_width = 340
         btn_height = 55
-        btn_font = ("Segoe UI", 16, "bold")
+        btn_font = self._f_btn
         btn_corner_radius = 20
 
         # Elevated Card for Buttons
@@ -306,7 +383,7 @@ class MainMenuApp(ctk.CTk):
         self.footer_label = ctk.CTkLabel(
             self.main_bg,
             text="v2.1 AI Edition | Powered by Vosk, Whisper & Spacy",
-            font=("Segoe UI", 12),
+            font=self._f_small,
             text_color="gray",
             fg_color="transparent"
         )
@@ -314,23 +391,27 @@ class MainMenuApp(ctk.CTk):
 
     # --- FUNCTIONALITY ---
     def open_voice_transcriber(self):
-        if HybridTranscriberApp is None:
+        app_cls = _lazy_load_app()
+        if app_cls is None:
             print("App module not found")
             return
         self.withdraw()
-        self.current_child = HybridTranscriberApp(self)
+        self.current_child = app_cls(self)
         self._setup_child_window(self.current_child)
 
     def open_study_assistant(self):
-        if StudyAssistantGUI is None:
+        gui_cls = _lazy_load_study_gui()
+        if gui_cls is None:
             print("Study GUI module not found")
             return
         self.withdraw()
-        self.current_child = StudyAssistantGUI(self)
+        self.current_child = gui_cls(self)
         self._setup_child_window(self.current_child)
 
     def _setup_child_window(self, child_window):
         def on_child_close():
+            if getattr(child_window, "is_recording", False):
+                child_window.stop_recording() # Finish the session's WAV and transcript
             child_window.destroy()
             self.current_child = None
             self.deiconify()
@@ -351,7 +432,7 @@ class MainMenuApp(ctk.CTk):
         settings_toplevel.grid_rowconfigure(4, weight=1)
 
         # Whisper Model Size
-        ctk.CTkLabel(settings_toplevel, text="Whisper Model Size:", font=("Segoe UI", 14, "bold")).grid(row=0, column=0, padx=20, pady=(20, 5), sticky="w")
+        ctk.CTkLabel(settings_toplevel, text="Whisper Model Size:", font=self._f_label).grid(row=0, column=0, padx=20, pady=(20, 5), sticky="w")
         
         whisper_model_sizes = ["tiny", "base", "small", "medium", "large"]
         current_whisper_size = config_manager.get_setting("whisper_model_size")
@@ -360,7 +441,7 @@ class MainMenuApp(ctk.CTk):
             settings_toplevel, 
             values=whisper_model_sizes, 
             command=self._on_whisper_size_change,
-            font=("Segoe UI", 14)
+            font=self._f_body
         )
         self.whisper_size_optionmenu.set(current_whisper_size)
         self.whisper_size_optionmenu.grid(row=0, column=1, padx=20, pady=(20, 5), sticky="ew")
@@ -369,12 +450,12 @@ class MainMenuApp(ctk.CTk):
         ctk.CTkFrame(settings_toplevel, height=2, fg_color="gray", corner_radius=0).grid(row=1, column=0, columnspan=2, padx=10, pady=(10, 10), sticky="ew")
 
         # Reinstall Models
-        ctk.CTkLabel(settings_toplevel, text="Model Management:", font=("Segoe UI", 14, "bold")).grid(row=2, column=0, padx=20, pady=(10, 5), sticky="w")
+        ctk.CTkLabel(settings_toplevel, text="Model Management:", font=self._f_label).grid(row=2, column=0, padx=20, pady=(10, 5), sticky="w")
         self.reinstall_models_button = ctk.CTkButton(
             settings_toplevel, 
             text="Reinstall Models", 
             command=self._reinstall_models_action,
-            font=("Segoe UI", 14),
+            font=self._f_body,
             fg_color="#F63049",
             hover_color="#D02752"
         )
@@ -385,7 +466,7 @@ class MainMenuApp(ctk.CTk):
             settings_toplevel,
             text="Clear All Models",
             command=self._clear_all_models_action,
-            font=("Segoe UI", 14),
+            font=self._f_body,
             fg_color="#CC0000",
             hover_color="#FF0000"
         )
@@ -419,16 +500,53 @@ class MainMenuApp(ctk.CTk):
             
             self.reinstall_button_reset()
 
-        threading.Thread(target=reinstall_thread).start()
+        self._submit_settings_task(reinstall_thread)
+
+    def _submit_settings_task(self, fn):
+        """Run a model task on the executor and poll its progress from the Tk thread."""
+        future = self.bg_exec.submit(fn)
+        future.add_done_callback(lambda f: self.settings_queue.put(("done", None)))
+        self._settings_pending += 1
+        if self._settings_pending == 1:
+            self.check_settings_queue()
+
+    def check_settings_queue(self):
+        """Drains settings_queue on the main thread; only the newest status is shown."""
+        latest = None
+        reset = []
+        try:
+            while True:
+                kind, payload = self.settings_queue.get_nowait()
+                if kind == "status":
+                    latest = payload
+                elif kind == "done":
+                    self._settings_pending -= 1
+                else:
+                    reset.append(payload)
+        except queue.Empty:
+            pass
+
+        if latest is not None and hasattr(self, 'settings_status_label'):
+            text, color = latest
+            try:
+                self.settings_status_label.configure(text=text, text_color=color)
+            except Exception:
+                pass # Settings window was closed
+        for fn in reset:
+            try:
+                fn()
+            except Exception:
+                pass
+
+        if self._settings_pending > 0:
+            self.after(50, self.check_settings_queue)
 
     def _update_settings_status(self, text, color):
-        # Helper to update label safely from thread (CTkiner is mostly thread-safe for configure but better to be safe)
-        # For simplicity in this method, we rely on CTk's handling or use after if needed. 
-        # But to be robust like the main loader:
-        self.after(0, lambda: self.settings_status_label.configure(text=text, text_color=color) if hasattr(self, 'settings_status_label') else None)
+        # Called from worker threads; the Tk thread applies it in check_settings_queue
+        self.settings_queue.put(("status", (text, color)))
 
     def reinstall_button_reset(self):
-        self.after(0, lambda: self.reinstall_models_button.configure(state="normal", text="Reinstall Models"))
+        self.settings_queue.put(("call", lambda: self.reinstall_models_button.configure(state="normal", text="Reinstall Models")))
 
     def _update_settings_download_progress(self, message, percentage):
         self._update_settings_status(message, "orange")
@@ -445,13 +563,24 @@ class MainMenuApp(ctk.CTk):
             else:
                 self._update_settings_status("Error clearing models. Check console.", "red")
             
-            self.after(0, lambda: self.clear_all_models_button.configure(state="normal", text="Clear All Models"))
+            self.settings_queue.put(("call", lambda: self.clear_all_models_button.configure(state="normal", text="Clear All Models")))
         
-        threading.Thread(target=clear_thread).start()
+        self._submit_settings_task(clear_thread)
 
     def exit_app(self):
-        self.quit()
-        sys.exit()
+        # A live recording is stopped first so its WAV and transcript get
+        # written; those threads are non-daemon and joined at interpreter exit
+        child = self.current_child
+        if child is not None and getattr(child, "is_recording", False):
+            child.stop_recording()
+        # Queued model tasks are dropped and a running download returns at its
+        # next check (Vosk keeps its .part file; Whisper/BART transfers run on
+        # daemon threads and end with the process), so the interpreter's join
+        # of the executor workers is short
+        config_manager.cancel_downloads()
+        self.bg_exec.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+        sys.exit(0)
 
 if __name__ == "__main__":
     app = MainMenuApp()
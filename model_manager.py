@@ -2,18 +2,16 @@ import os
 import shutil
 import threading
 import hashlib
+import hmac
 import requests
 import gc
 import json
 import sys
-from typing import Dict, Any, Optional
+import functools
+from collections import OrderedDict
+from typing import Any, Optional
 from tqdm import tqdm
 
-try:
-    import torch
-except ImportError:
-    torch = None
-
 try:
     from utils.logger import setup_logger
 except ImportError:
@@ -29,6 +27,74 @@ except ImportError:
 
 logger = setup_logger("ModelManager")
 
+@functools.lru_cache(maxsize=1)
+def _torch():
+    """Imports torch on first use; None when it isn't installed."""
+    try:
+        import torch
+        return torch
+    except ImportError:
+        return None
+
+def _empty_device_cache():
+    """Releases cached CUDA/MPS memory after models are dropped."""
+    t = _torch()
+    if not t:
+        return
+    if t.cuda.is_available():
+        t.cuda.empty_cache()
+    elif hasattr(t.backends, "mps") and t.backends.mps.is_available():
+        # Check if torch.mps exists (available in torch 2.0+)
+        if hasattr(t, "mps"):
+            t.mps.empty_cache()
+
+def _warm_cache(path: str):
+    """Asks the OS to pull a model folder into the page cache ahead of loading.
+
+    Only a readahead hint: where posix_fadvise is missing (Windows, macOS)
+    nothing is done, since reading the files here would cost a full extra
+    disk pass whenever they are already cached.
+    """
+    fadvise = getattr(os, "posix_fadvise", None)
+    if fadvise is None:
+        return
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                fd = os.open(os.path.join(root, name), os.O_RDONLY)
+                try:
+                    fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+def _sha256_hexdigest(f) -> str:
+    """SHA-256 of a whole binary file object, hashed in C rather than per chunk."""
+    f.seek(0)
+    if hasattr(hashlib, "file_digest"): # Python 3.11+
+        return hashlib.file_digest(f, "sha256").hexdigest()
+    import mmap
+    h = hashlib.sha256()
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            h.update(m)
+    except (OSError, ValueError):
+        # Empty files can't be mapped
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+class _ProgressFile:
+    """Write-through file wrapper that advances a tqdm bar."""
+    def __init__(self, f, bar):
+        self.f = f
+        self.bar = bar
+
+    def write(self, b):
+        self.bar.update(len(b))
+        return self.f.write(b)
+
 class ModelManager:
     """
     Singleton class for managing AI models (Download, Load, Unload, Cache).
@@ -41,7 +107,8 @@ class ModelManager:
     MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
     
     # Model Metadata (URLs and Expected Hashes)
-    # Note: Hash check is critical for production security/integrity
+    # Note: Hash check is critical for production security/integrity;
+    # _download_file verifies an entry's "sha256" whenever one is set
     MODEL_REGISTRY = {
         "vosk-small": {
             "url": "https://alphacephei.com/vosk/models/vosk-model-small-en-us-0.15.zip",
@@ -67,7 +134,13 @@ class ModelManager:
     def __init__(self):
         if self._initialized: return
         with self._lock:
-            self._loaded_models: Dict[str, Any] = {}
+            # Oldest-used first; evicted from the front under memory pressure
+            self._loaded_models: "OrderedDict[str, Any]" = OrderedDict()
+            # One pooled session so repeated downloads reuse TCP/TLS connections
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
             os.makedirs(self.MODELS_DIR, exist_ok=True)
             logger.info(f"ModelManager initialized. Storage: {self.MODELS_DIR}")
             self._initialized = True
@@ -85,6 +158,7 @@ class ModelManager:
         with self._lock:
             if key in self._loaded_models:
                 logger.debug(f"Returning cached model: {key}")
+                self._loaded_models.move_to_end(key)
                 return self._loaded_models[key]
             
             # Check Resource Availability
@@ -112,12 +186,7 @@ class ModelManager:
             if key in self._loaded_models:
                 del self._loaded_models[key]
                 gc.collect()
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                    # Check if torch.mps exists (available in torch 2.0+)
-                    if hasattr(torch, "mps"):
-                        torch.mps.empty_cache()
+                _empty_device_cache()
                 logger.info(f"Unloaded model: {key}")
 
     def unload_all(self):
@@ -126,11 +195,7 @@ class ModelManager:
             for key in keys:
                 del self._loaded_models[key]
             gc.collect()
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-            elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                if hasattr(torch, "mps"):
-                    torch.mps.empty_cache()
+            _empty_device_cache()
             logger.info("All models unloaded.")
 
     def _check_memory_pressure(self):
@@ -141,13 +206,24 @@ class ModelManager:
         mem = psutil.virtual_memory()
         if mem.percent > 85:
             logger.warning(f"High memory usage detected ({mem.percent}%). Attempting to clear cache...")
-            # Simple strategy: Unload Whisper if loading BART, etc.
-            # For now, just log. In production, we might force unload all idle models.
-            pass
+            self._evict_lru()
+
+    def _evict_lru(self, target_pct: float = 70):
+        """Unloads least recently used models until memory use is under target_pct."""
+        import psutil
+        evicted = False
+        while self._loaded_models and psutil.virtual_memory().percent > target_pct:
+            key, _ = self._loaded_models.popitem(last=False)
+            logger.info(f"Evicted model: {key}")
+            # Freed memory only shows up in psutil once the objects are collected
+            gc.collect()
+            evicted = True
+        if evicted:
+            _empty_device_cache()
 
     def _load_vosk(self, model_name: str):
         import vosk
-        import zipfile
+        from config_manager import _extract_subfolder
         
         # 1. Check path
         model_path = os.path.join(self.MODELS_DIR, self.MODEL_REGISTRY.get(model_name, {}).get("folder_name", model_name))
@@ -160,16 +236,20 @@ class ModelManager:
                 # Fallback or error
                 raise ValueError(f"No URL configured for Vosk model: {model_name}")
             
+            # The archive streams into <zip>.part, so an interrupted run resumes
             zip_path = os.path.join(self.MODELS_DIR, f"{model_name}.zip")
-            self._download_file(url, zip_path)
-            
+            expected = self.MODEL_REGISTRY.get(model_name, {}).get("sha256")
+            self._download_file(url, zip_path, sha256=expected)
+
             logger.info("Extracting...")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.MODELS_DIR)
+            # Shared with config_manager: one ZipFile per worker thread, a
+            # free-space check and a guard against paths escaping MODELS_DIR
+            _extract_subfolder(zip_path, "", self.MODELS_DIR)
             os.remove(zip_path)
             logger.info("Extraction complete.")
 
-        # 3. Load
+        # 3. Load, with the files being prefetched sequentially alongside
+        threading.Thread(target=_warm_cache, args=(model_path,), daemon=True).start()
         return vosk.Model(model_path)
 
     def _load_whisper(self, model_size: str):
@@ -189,42 +269,95 @@ class ModelManager:
         
         # Cross-platform device detection
         device = -1
-        if torch:
-            if torch.cuda.is_available():
+        t = _torch()
+        if t:
+            if t.cuda.is_available():
                 device = 0
-            elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+            elif hasattr(t.backends, "mps") and t.backends.mps.is_available():
                 # Note: Transformers pipeling 'device' argument handles string names too
                 device = "mps"
         
         logger.info(f"Using device for BART: {device}")
         return pipeline("summarization", model=model_name, device=device)
 
-    def _download_file(self, url: str, path: str):
-        """Downloads a file with progress bar and resumability."""
+    def _download_file(self, url: str, path: str, attempts: int = 3, sha256: Optional[str] = None):
+        """Downloads a file with progress bar and resumability.
+
+        Data goes to path + '.part' and is renamed to path once complete, so
+        a later call (or a retry after a dropped connection) resumes the
+        partial file with an HTTP Range request. When sha256 is given the
+        finished download must match it.
+        """
+        import urllib3
+
         # Check disk space (Need > 1GB safe margin)
         total, used, free = shutil.disk_usage(self.MODELS_DIR)
         if free < 1 * 1024 * 1024 * 1024:
             raise OSError("Insufficient disk space to download model.")
 
-        response = requests.get(url, stream=True)
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 1024 # 1 Kibibyte
-        
-        with open(path, 'wb') as file, tqdm(
-            desc=os.path.basename(path),
-            total=total_size,
-            unit='iB',
-            unit_scale=True,
-            unit_divisor=1024,
-        ) as bar:
-            for data in response.iter_content(block_size):
-                file.write(data)
-                bar.update(len(data))
+        block_size = 1 << 20 # 1 MiB; 1 KiB reads cost a Python iteration per KB
+        part = path + '.part'
+        file = open(part, 'ab')
+        total_size = 0
+        try:
+            with tqdm(
+                desc=os.path.basename(path),
+                unit='iB',
+                unit_scale=True,
+                unit_divisor=1024,
+            ) as bar:
+                out = _ProgressFile(file, bar)
+                for attempt in range(attempts):
+                    existing = file.tell()
+                    # identity keeps Content-Length equal to the bytes that land on disk
+                    headers = {'Accept-Encoding': 'identity'}
+                    if existing:
+                        headers['Range'] = f'bytes={existing}-'
+                    try:
+                        response = self._session.get(url, stream=True, headers=headers)
+                        if existing and response.status_code == 416:
+                            # Nothing left to fetch; the size check below decides
+                            total_size = existing
+                            break
+                        response.raise_for_status()
+                        response.raw.decode_content = True
+                        length = int(response.headers.get('content-length', 0))
+                        if existing and response.status_code == 206:
+                            content_range = response.headers.get('content-range', '')
+                            total_size = int(content_range.rsplit('/', 1)[-1]) if content_range[-1:].isdigit() else existing + length
+                        else:
+                            # Server ignored the Range header; start from scratch
+                            if existing:
+                                logger.info("Server does not support resume; restarting download.")
+                                file.seek(0)
+                                file.truncate()
+                                existing = 0
+                            total_size = length
+                        bar.reset(total=total_size or None)
+                        bar.update(existing)
+                        shutil.copyfileobj(response.raw, out, length=block_size)
+                        break
+                    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+                        if attempt == attempts - 1:
+                            raise
+                        logger.warning(f"Download interrupted ({e}); resuming...")
+                written = file.tell()
+        finally:
+            file.close()
                 
-        if total_size != 0 and os.path.getsize(path) != total_size:
-            os.remove(path)
+        if total_size != 0 and written != total_size:
+            os.remove(part)
             raise ConnectionError("Download incomplete/corrupt.")
 
+        if sha256:
+            with open(part, 'rb') as f:
+                digest = _sha256_hexdigest(f)
+            if not hmac.compare_digest(digest, sha256.lower()):
+                os.remove(part)
+                raise ConnectionError(f"Checksum mismatch for {os.path.basename(path)}.")
+
+        os.replace(part, path)
+
 # Singleton Accessor
 def get_model_manager():
     return ModelManager()